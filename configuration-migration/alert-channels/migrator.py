@@ -1,15 +1,110 @@
 """Core functionality for migrating alert channels between backends."""
 
 import sys
+import logging
 import requests
+import shutil
 import urllib3
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple
 
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config import Config
+import fast_json
+
+# Use aiohttp for concurrent request fan-out when available
+try:
+    import asyncio
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# ijson streams the channels listing one entry at a time instead of
+# materializing the whole document; prefer the C backend when present
+try:
+    import ijson
+    try:
+        import ijson.backends.yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Parse failures the file reader reports to the user; ijson raises its
+# own error type for malformed documents
+_SOURCE_PARSE_ERRORS = (FileNotFoundError, json.JSONDecodeError)
+if IJSON_AVAILABLE:
+    _SOURCE_PARSE_ERRORS = _SOURCE_PARSE_ERRORS + (ijson.JSONError,)
+
+logger = logging.getLogger(__name__)
+
+# Disable the insecure-request warning only once per process; repeated calls
+# just churn warnings.filters when many migrators are constructed
+_ssl_warnings_disabled = False
+
+
+def _disable_ssl_warnings() -> None:
+    global _ssl_warnings_disabled
+    if not _ssl_warnings_disabled:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        _ssl_warnings_disabled = True
+
+# Required fields per channel kind, applied when the source omits them
+CHANNEL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'EMAIL': {
+        'emails': ["example@example.com"],
+        'customEmailSubjectPrefix': None,
+    },
+    'SLACK': {
+        'webhookUrl': "https://example.com/webhook",
+        'channel': "alerts",
+        'emojiRendering': False,
+    },
+    'WEB_HOOK': {
+        'webhookUrls': ["https://webhook.example.com"],
+        'headers': [],
+    },
+    'BIDIRECTIONAL_SLACK': {
+        'appId': "placeholder_app_id",
+        'teamId': "placeholder_team_id",
+        'channelId': "placeholder_channel_id",
+        'channelName': "alerts",
+        'emojiRendering': False,
+    },
+    'BIDIRECTIONAL_MS_TEAMS': {
+        'apiTokenId': "placeholder_token_id",
+        'channelId': "placeholder_channel_id",
+        'channelName': "alerts",
+        'instanaUrl': "https://instana.example.com",
+        'serviceUrl': "https://teams.example.com",
+        'teamId': "placeholder_team_id",
+        'teamName': "placeholder_team",
+        'tenantId': "placeholder_tenant_id",
+        'tenantName': "placeholder_tenant",
+    },
+    'GOOGLE_CHAT': {
+        'webhookUrl': "https://chat.googleapis.com/webhook",
+    },
+    'OFFICE_365': {
+        'webhookUrl': "https://webhook.office365.com/webhook",
+    },
+    'OPS_GENIE': {
+        'apiKey': "placeholder_api_key",
+        'region': "US",
+        'alias': "",
+        'tags': "",
+    },
+    'PAGER_DUTY': {
+        'serviceIntegrationKey': "placeholder_integration_key",
+    },
+}
 
 
 class AlertChannelsMigrator:
@@ -17,16 +112,47 @@ class AlertChannelsMigrator:
 
     def __init__(self, config: Config):
         """Initialize the migrator with configuration.
-        
+
         Args:
             config: Configuration object with backend details
         """
         self.config = config
         self.req_alert_channels = "/api/events/settings/alertingChannels"
-        
+        # Endpoint URLs never change for the lifetime of the migrator, so
+        # build them once instead of an f-string concat per request
+        self._source_channels_url = f"{config.source_url}{self.req_alert_channels}"
+        self._target_channels_url = f"{config.target_url}{self.req_alert_channels}"
+
+        # Build the auth headers once; they are identical for every request
+        self._source_headers = config.get_source_headers()
+        self._target_headers = config.get_target_headers()
+
+        # Conditional-request state for the target listing: when the
+        # backend replies 304 Not Modified on a retried run, the cached
+        # list is reused instead of re-downloading and re-parsing it
+        self._target_etag = None
+        self._target_cache = None
+
+        # Reuse one pooled session so keep-alive connections are shared
+        # across all requests instead of a new TLS handshake per call.
+        # requests speaks HTTP/1.1 only; concurrency across pooled
+        # connections (and the aiohttp path) stands in for HTTP/2
+        # multiplexing without changing HTTP stacks.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Fan requests out over asyncio + aiohttp when the dependency exists
+        self._use_async = AIOHTTP_AVAILABLE
+
         # Disable SSL warnings if verify_ssl is False
         if not config.verify_ssl:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_ssl_warnings()
     
     def migrate(self) -> Dict[str, int]:
         """Perform the migration of alert channels.
@@ -37,59 +163,77 @@ class AlertChannelsMigrator:
         # Validate configuration before proceeding
         self.config.validate()
         
-        print("Starting migration of alert channel configurations...")
+        logger.info("Starting migration of alert channel configurations...")
         
         # Get source channels
         source_channels = self._get_source_channels()
         if source_channels is None:
             return {"source": 0, "migrated": 0, "updated": 0, "skipped": 0}
-        
+
+        # Nothing to migrate, so skip the target listing round trip entirely
+        if not source_channels:
+            logger.info("No source channels found, nothing to migrate.")
+            return {"source": 0, "migrated": 0, "updated": 0, "skipped": 0}
+
         # Get target channels to avoid duplicates
-        target_channels = self._get_target_channels()
+        target_channels = self._get_target_channels() if not self.config.skip_duplicate_check else []
         if target_channels is None:
             return {"source": len(source_channels), "migrated": 0, "updated": 0, "skipped": 0}
         
-        # Extract names of existing channels in target system for comparison
-        target_channel_names = [channel.get('name') for channel in target_channels if channel.get('name')]
+        # Index existing target channels by name once for O(1) duplicate lookups
+        target_by_name = {channel['name']: channel for channel in target_channels if channel.get('name')}
         
         # Counter for migrated channels
-        migrated_count = 0
         skipped_count = 0
-        updated_count = 0
         source_channels_count = len(source_channels)
-        
-        # Process each alert channel from source
+
+        # Phase 1: resolve all interactive prompts serially so input() never
+        # blocks the workers, collecting (channel, name, target_channel) actions
+        actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]] = []
         for channel in source_channels:
             # Extract channel name for comparison
             channel_name = channel.get('name')
-            
+
             if not channel_name:
-                print("Skipping channel with no name")
+                logger.info("Skipping channel with no name")
                 continue
-            
+
+            # Format once up front so retried or re-dispatched requests reuse
+            # the same payload; the formatter mutates in place and is
+            # idempotent, so the later call in create/update is free
+            channel = self._format_channel_for_api(channel)
+
             # Check if channel with same name already exists in target
-            if channel_name in target_channel_names:
-                # Prompt user for choice
-                choice = self._prompt_for_duplicate_channel(str(channel_name))
+            if channel_name in target_by_name:
+                # Use the configured non-interactive action when set, so batch
+                # runs are never serialized by input() prompts
+                if self.config.on_duplicate != 'ask':
+                    choice = self.config.on_duplicate
+                else:
+                    choice = self._prompt_for_duplicate_channel(str(channel_name))
                 if choice == 'skip':
-                    print(f"Skipping channel '{channel_name}' - already exists in target system")
+                    logger.info(f"Skipping channel '{channel_name}' - already exists in target system")
                     skipped_count += 1
                     continue
                 if choice == 'update':
-                    print(f"Updating channel '{channel_name}' - already exists in target system")
-                    if self._update_channel(channel, str(channel_name), target_channels):
-                        updated_count += 1
-                        continue
+                    logger.info(f"Updating channel '{channel_name}' - already exists in target system")
+                    actions.append((channel, str(channel_name), target_by_name[channel_name]))
+                    continue
                 elif choice == 'cancel':
-                    print("Migration cancelled by user")
+                    logger.info("Migration cancelled by user")
                     break
-                
+
             # Note: We keep the 'id' field as the API seems to require it
             # Create the channel in target system
-            if self._create_channel(channel, str(channel_name)):
-                migrated_count += 1
-        
-        print(f"Migration complete. Found {source_channels_count} source channels, "
+            actions.append((channel, str(channel_name), None))
+
+        # Phase 2: execute the create/update calls concurrently over the
+        # pooled session; the requests are independent and purely I/O bound
+        results = self._execute_actions(actions)
+        migrated_count = results.count('created')
+        updated_count = results.count('updated')
+
+        logger.info(f"Migration complete. Found {source_channels_count} source channels, "
               f"migrated {migrated_count} alert channels, updated {updated_count} channels, "
               f"skipped {skipped_count} existing channels.")
         
@@ -100,6 +244,144 @@ class AlertChannelsMigrator:
             "skipped": skipped_count
         }
     
+    # The Instana settings API has no bulk create/update endpoint, so round
+    # trips are amortized by issuing the per-item requests concurrently over
+    # one shared keep-alive pool rather than batching payloads server-side.
+    def _execute_actions(self, actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]],
+                         max_workers: int = 8) -> List[str]:
+        """Run the collected create/update actions, in parallel when possible.
+
+        Args:
+            actions: List of (channel, channel_name, target_channel) tuples,
+                where target_channel is the duplicate to update or None
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of results: 'created', 'updated', or 'failed'
+        """
+        def run_action(action: Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]) -> str:
+            channel, channel_name, target_channel = action
+            if target_channel is not None:
+                if self._update_channel(channel, channel_name, target_channel):
+                    return 'updated'
+            # Fall back to creation when not updating or the update failed
+            if self._create_channel(channel, channel_name):
+                return 'created'
+            return 'failed'
+
+        # Keep the serial path for single actions for easier debugging
+        workers = min(max_workers, len(actions))
+        if workers <= 1:
+            return [run_action(action) for action in actions]
+
+        if self._use_async:
+            return asyncio.run(self._execute_actions_async(actions, max_workers))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_action, actions))
+
+    async def _execute_actions_async(self, actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]],
+                                     max_concurrent: int = 8) -> List[str]:
+        """Run the collected create/update actions concurrently with aiohttp.
+
+        Args:
+            actions: List of (channel, channel_name, target_channel) tuples,
+                where target_channel is the duplicate to update or None
+            max_concurrent: Maximum number of in-flight requests
+
+        Returns:
+            List of results: 'created', 'updated', or 'failed'
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=32, ssl=None if self.config.verify_ssl else False)
+
+        async def run_action(session: aiohttp.ClientSession,
+                             action: Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]) -> str:
+            channel, channel_name, target_channel = action
+            async with semaphore:
+                if target_channel is not None:
+                    if await self._update_channel_async(session, channel, channel_name, target_channel):
+                        return 'updated'
+                # Fall back to creation when not updating or the update failed
+                if await self._create_channel_async(session, channel, channel_name):
+                    return 'created'
+                return 'failed'
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return list(await asyncio.gather(*[run_action(session, action) for action in actions]))
+
+    async def _create_channel_async(self, session: 'aiohttp.ClientSession',
+                                    channel: Dict[str, Any], channel_name: str) -> bool:
+        """Create an alert channel in the target backend via aiohttp.
+
+        Args:
+            session: Open aiohttp client session
+            channel: Alert channel configuration to create
+            channel_name: Name of the channel for logging
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            formatted_channel = self._format_channel_for_api(channel)
+            async with session.post(
+                self._target_channels_url,
+                headers=self._target_headers,
+                json=formatted_channel
+            ) as response:
+                response.raise_for_status()
+                new_channel = await response.json()
+
+            if 'id' in new_channel:
+                logger.info(f"Migrated alert channel '{channel_name}' (Target ID: {new_channel['id']})")
+                return True
+            else:
+                logger.info(f"Failed to migrate alert channel '{channel_name}' - no ID returned")
+                return False
+        except aiohttp.ClientError as e:
+            logger.info(f"Failed to migrate alert channel '{channel_name}'")
+            logger.info(f"Error: {e}")
+            return False
+
+    async def _update_channel_async(self, session: 'aiohttp.ClientSession',
+                                    channel: Dict[str, Any], channel_name: str,
+                                    target_channel: Optional[Dict[str, Any]]) -> bool:
+        """Update an existing alert channel in the target backend via aiohttp.
+
+        Args:
+            session: Open aiohttp client session
+            channel: Alert channel configuration to update
+            channel_name: Name of the channel for logging
+            target_channel: Matching channel from the target system
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not target_channel or 'id' not in target_channel:
+                logger.info(f"Failed to find matching target channel for '{channel_name}'")
+                return False
+
+            formatted_channel = self._format_channel_for_api(channel)
+            async with session.put(
+                f"{self._target_channels_url}/{target_channel['id']}",
+                headers=self._target_headers,
+                json=formatted_channel
+            ) as response:
+                response.raise_for_status()
+                updated_channel = await response.json()
+
+            if 'id' in updated_channel:
+                logger.info(f"Updated alert channel '{channel_name}' (Target ID: {updated_channel['id']})")
+                return True
+            else:
+                logger.info(f"Failed to update alert channel '{channel_name}' - no ID returned")
+                return False
+        except aiohttp.ClientError as e:
+            logger.info(f"Failed to update alert channel '{channel_name}'")
+            logger.info(f"Error: {e}")
+            return False
+
     def _format_channel_for_api(self, channel: Dict[str, Any]) -> Dict[str, Any]:
         """Format channel data according to the specific channel type requirements.
         
@@ -109,105 +391,22 @@ class AlertChannelsMigrator:
         Returns:
             Formatted channel data for API request
         """
-        # Create a copy to avoid modifying the original
-        formatted = channel.copy()
-        
+        # The caller owns the parsed channel dict and never reuses the raw
+        # form, so mutate in place instead of copying the whole dict
+
         # Remove fields that shouldn't be sent in creation/update
         # Note: We keep the 'id' field as the API seems to require it
-        if 'rbacTags' in formatted:
-            del formatted['rbacTags']
-            
-        # Get the channel type
-        channel_type = formatted.get('kind')
-        
-        # Format according to channel type
-        if channel_type == 'EMAIL':
-            # Ensure required fields are present
-            if 'emails' not in formatted:
-                formatted['emails'] = ["example@example.com"]
-            if 'customEmailSubjectPrefix' not in formatted:
-                formatted['customEmailSubjectPrefix'] = None
-                
-        elif channel_type == 'SLACK':
-            # Ensure required fields are present
-            if 'webhookUrl' not in formatted:
-                formatted['webhookUrl'] = "https://example.com/webhook"
-            if 'channel' not in formatted:
-                formatted['channel'] = "alerts"
-            if 'emojiRendering' not in formatted:
-                formatted['emojiRendering'] = False
-                
-        elif channel_type == 'WEB_HOOK':
-            # Ensure required fields are present
-            if 'webhookUrls' not in formatted:
-                formatted['webhookUrls'] = ["https://webhook.example.com"]
-            if 'headers' not in formatted:
-                formatted['headers'] = []
-                
-        elif channel_type == 'BIDIRECTIONAL_SLACK':
-            # Ensure required fields are present
-            if 'appId' not in formatted:
-                formatted['appId'] = "placeholder_app_id"
-            if 'teamId' not in formatted:
-                formatted['teamId'] = "placeholder_team_id"
-            if 'channelId' not in formatted:
-                formatted['channelId'] = "placeholder_channel_id"
-            if 'channelName' not in formatted:
-                formatted['channelName'] = "alerts"
-            if 'emojiRendering' not in formatted:
-                formatted['emojiRendering'] = False
-                
-        elif channel_type == 'BIDIRECTIONAL_MS_TEAMS':
-            # Ensure required fields are present
-            if 'apiTokenId' not in formatted:
-                formatted['apiTokenId'] = "placeholder_token_id"
-            if 'channelId' not in formatted:
-                formatted['channelId'] = "placeholder_channel_id"
-            if 'channelName' not in formatted:
-                formatted['channelName'] = "alerts"
-            if 'instanaUrl' not in formatted:
-                formatted['instanaUrl'] = "https://instana.example.com"
-            if 'serviceUrl' not in formatted:
-                formatted['serviceUrl'] = "https://teams.example.com"
-            if 'teamId' not in formatted:
-                formatted['teamId'] = "placeholder_team_id"
-            if 'teamName' not in formatted:
-                formatted['teamName'] = "placeholder_team"
-            if 'tenantId' not in formatted:
-                formatted['tenantId'] = "placeholder_tenant_id"
-            if 'tenantName' not in formatted:
-                formatted['tenantName'] = "placeholder_tenant"
-                
-        elif channel_type == 'GOOGLE_CHAT':
-            # Ensure required fields are present
-            if 'webhookUrl' not in formatted:
-                formatted['webhookUrl'] = "https://chat.googleapis.com/webhook"
-                
-        elif channel_type == 'OFFICE_365':
-            # Ensure required fields are present
-            if 'webhookUrl' not in formatted:
-                formatted['webhookUrl'] = "https://webhook.office365.com/webhook"
-                
-        elif channel_type == 'OPS_GENIE':
-            # Ensure required fields are present
-            if 'apiKey' not in formatted:
-                formatted['apiKey'] = "placeholder_api_key"
-            if 'region' not in formatted:
-                formatted['region'] = "US"
-            if 'alias' not in formatted:
-                formatted['alias'] = ""
-            if 'tags' not in formatted:
-                formatted['tags'] = ""
-                
-        elif channel_type == 'PAGER_DUTY':
-            # Ensure required fields are present
-            if 'serviceIntegrationKey' not in formatted:
-                formatted['serviceIntegrationKey'] = "placeholder_integration_key"
-                
-        # For any other channel types, keep as is
-        # Add more channel types as needed
-        
-        return formatted
+        channel.pop('rbacTags', None)
+
+        # Fill in required fields for the channel kind from the defaults
+        # table; list defaults are copied so the table is never aliased.
+        # Unknown channel kinds are kept as is.
+        defaults = CHANNEL_DEFAULTS.get(channel.get('kind'), {})
+        for key, value in defaults.items():
+            if key not in channel:
+                channel[key] = list(value) if isinstance(value, list) else value
+
+        return channel
     
     def _get_source_channels(self) -> Optional[List[Dict[str, Any]]]:
         """Get all alert channel configurations from source backend or file.
@@ -219,35 +418,51 @@ class AlertChannelsMigrator:
         if self.config.events_source.lower() == "file":
             try:
                 file_path = self.config.events_file_path
-                print(f"Reading alert channels from {file_path} file...")
-                with open(file_path, 'r') as f:
-                    channels = json.load(f)
-                print(f"Successfully loaded {len(channels)} channels from file")
+                logger.info(f"Reading alert channels from {file_path} file...")
+                if IJSON_AVAILABLE:
+                    # Stream the array one channel at a time so peak memory
+                    # is the result list, not the raw document plus the
+                    # parse tree
+                    with open(file_path, 'rb') as f:
+                        channels = list(ijson_backend.items(f, 'item', use_float=True))
+                else:
+                    with open(file_path, 'r') as f:
+                        channels = fast_json.load(f)
+                logger.info(f"Successfully loaded {len(channels)} channels from file")
                 return channels
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                print(f"Error reading {self.config.events_file_path} file: {e}")
-                print("Make sure the file exists and contains valid JSON")
+            except _SOURCE_PARSE_ERRORS as e:
+                logger.info(f"Error reading {self.config.events_file_path} file: {e}")
+                logger.info("Make sure the file exists and contains valid JSON")
                 return None
         else:
             # Default behavior - fetch from API
             try:
-                print("Fetching alert channels from API endpoint...")
-                response = requests.get(
-                    f"{self.config.source_url}{self.req_alert_channels}",
-                    headers=self.config.get_source_headers(),
-                    verify=self.config.verify_ssl
+                logger.info("Fetching alert channels from API endpoint...")
+                response = self.session.get(
+                    self._source_channels_url,
+                    headers=self._source_headers,
+                    verify=self.config.verify_ssl,
+                    stream=True
                 )
                 response.raise_for_status()
-                channels = response.json()
-                
-                # Write the response to the configured file path
-                with open(self.config.events_file_path, 'w') as f:
-                    json.dump(channels, f, indent=2)
-                
-                print(f"Successfully fetched {len(channels)} channels from API")
+
+                # urllib3 hands back the wire bytes unless told otherwise;
+                # without this a gzip-encoded listing would be written to
+                # disk compressed and fail to parse on reload
+                response.raw.decode_content = True
+
+                # Stream the raw body straight to the configured file path and
+                # parse once from disk, instead of parsing in memory and then
+                # re-serializing the whole list with json.dump
+                with open(self.config.events_file_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f)
+                with open(self.config.events_file_path, 'r') as f:
+                    channels = fast_json.load(f)
+
+                logger.info(f"Successfully fetched {len(channels)} channels from API")
                 return channels
             except requests.exceptions.RequestException as e:
-                print(f"Error retrieving source channels from API: {e}")
+                logger.info(f"Error retrieving source channels from API: {e}")
                 return None
     
     def _get_target_channels(self) -> Optional[List[Dict[str, Any]]]:
@@ -256,16 +471,24 @@ class AlertChannelsMigrator:
         Returns:
             List of alert channel configurations or None if failed
         """
+        headers = self._target_headers
+        if self._target_etag is not None:
+            headers = {**headers, "If-None-Match": self._target_etag}
         try:
-            response = requests.get(
-                f"{self.config.target_url}{self.req_alert_channels}", 
-                headers=self.config.get_target_headers(), 
+            response = self.session.get(
+                self._target_channels_url,
+                headers=headers,
                 verify=self.config.verify_ssl
             )
+            if response.status_code == 304:
+                logger.info("Target channels unchanged since last fetch, using cached listing")
+                return self._target_cache
             response.raise_for_status()
-            return response.json()
+            self._target_etag = response.headers.get("ETag")
+            self._target_cache = response.json()
+            return self._target_cache
         except requests.exceptions.RequestException as e:
-            print(f"Error retrieving target channels: {e}")
+            logger.info(f"Error retrieving target channels: {e}")
             return None
     
     def _prompt_for_duplicate_channel(self, channel_name: str) -> str:
@@ -278,6 +501,10 @@ class AlertChannelsMigrator:
             User choice: 'skip', 'update', or 'cancel'
         """
         while True:
+            # Flush any buffered log output before prompting so the question
+            # appears after the messages that led up to it
+            for handler in logging.getLogger().handlers:
+                handler.flush()
             print(f"\nAlert channel '{channel_name}' already exists in the target system.")
             print("Choose an action:")
             print("  [s] Skip")
@@ -308,89 +535,86 @@ class AlertChannelsMigrator:
         try:
             # Format the channel data for the API
             formatted_channel = self._format_channel_for_api(channel)
-            
-            # Debug: Print the formatted data being sent
-            print(f"Creating channel '{channel_name}' with data:")
-            print(json.dumps(formatted_channel, indent=2))
-            
-            # Debug: Print headers being sent
-            headers = self.config.get_target_headers()
-            print(f"Request headers: {headers}")
-            
-            response = requests.post(
-                f"{self.config.target_url}{self.req_alert_channels}",
+
+            # Only pay for the payload/header formatting when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Creating channel '%s' with payload: %s", channel_name, formatted_channel)
+
+            headers = self._target_headers
+            response = self.session.post(
+                self._target_channels_url,
                 headers=headers,
                 json=formatted_channel,
                 verify=self.config.verify_ssl
             )
-            
-            # Debug: Print response details
-            print(f"Response status: {response.status_code}")
-            print(f"Response headers: {dict(response.headers)}")
-            print(f"Response content: {response.text[:500]}...")
-            
-            response.raise_for_status()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response status %s, headers %s, content %s",
+                             response.status_code, dict(response.headers), response.content[:500])
+
+            # Any 2xx counts as success (the API answers 200/201/202
+            # depending on version); the boolean check is also cheaper on
+            # the failure path than raising and catching HTTPError
+            if not response.ok:
+                logger.info(f"Failed to migrate alert channel '{channel_name}' - HTTP {response.status_code}")
+                return False
             new_channel = response.json()
             
             if 'id' in new_channel:
-                print(f"Migrated alert channel '{channel_name}' (Target ID: {new_channel['id']})")
+                logger.info(f"Migrated alert channel '{channel_name}' (Target ID: {new_channel['id']})")
                 return True
             else:
-                print(f"Failed to migrate alert channel '{channel_name}' - no ID returned")
+                logger.info(f"Failed to migrate alert channel '{channel_name}' - no ID returned")
                 return False
         except requests.exceptions.RequestException as e:
-            print(f"Failed to migrate alert channel '{channel_name}'")
-            print(f"Error: {e}")
+            logger.info(f"Failed to migrate alert channel '{channel_name}'")
+            logger.info(f"Error: {e}")
             return False
             
-    def _update_channel(self, channel: Dict[str, Any], channel_name: str, target_channels: List[Dict[str, Any]]) -> bool:
+    def _update_channel(self, channel: Dict[str, Any], channel_name: str, target_channel: Optional[Dict[str, Any]]) -> bool:
         """Update an existing alert channel in the target backend.
-        
+
         Args:
             channel: Alert channel configuration to update
             channel_name: Name of the channel for logging
-            target_channels: List of channels from the target system
-            
+            target_channel: Matching channel from the target system
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Use the provided target_channels instead of making another API call
-            if not target_channels:
-                print(f"No target channels provided for updating '{channel_name}'")
-                return False
-            
-            # Find the matching channel in target system by name
-            target_channel = next((c for c in target_channels if c.get('name') == channel_name), None)
+            # The caller already resolved the duplicate from its name index
             if not target_channel or 'id' not in target_channel:
-                print(f"Failed to find matching target channel for '{channel_name}'")
+                logger.info(f"Failed to find matching target channel for '{channel_name}'")
                 return False
-            
+
             # Use the target channel ID
             target_channel_id = target_channel['id']
-            print(f"Updating channel with ID: {target_channel_id}")
+            logger.info(f"Updating channel with ID: {target_channel_id}")
             
             # Format the channel data for the API
             formatted_channel = self._format_channel_for_api(channel)
             
-            response = requests.put(
-                f"{self.config.target_url}{self.req_alert_channels}/{target_channel_id}",
-                headers=self.config.get_target_headers(),
+            response = self.session.put(
+                f"{self._target_channels_url}/{target_channel_id}",
+                headers=self._target_headers,
                 json=formatted_channel,
                 verify=self.config.verify_ssl
             )
-            response.raise_for_status()
+            if not response.ok:
+                logger.info(f"Failed to update alert channel '{channel_name}' - HTTP {response.status_code}")
+                return False
             updated_channel = response.json()
             
             if 'id' in updated_channel:
-                print(f"Updated alert channel '{channel_name}' (Target ID: {updated_channel['id']})")
+                logger.info(f"Updated alert channel '{channel_name}' (Target ID: {updated_channel['id']})")
                 return True
             else:
-                print(f"Failed to update alert channel '{channel_name}' - no ID returned")
+                logger.info(f"Failed to update alert channel '{channel_name}' - no ID returned")
                 return False
         except requests.exceptions.RequestException as e:
-            print(f"Failed to update alert channel '{channel_name}'")
-            print(f"Error: {e}")
+            logger.info(f"Failed to update alert channel '{channel_name}'")
+            logger.info(f"Error: {e}")
             return False
 
 # Made with Bob
\ No newline at end of file
@@ -1,65 +1,159 @@
 import json
+import logging
 import requests
 import urllib3
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Tuple
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config import Config
+import fast_json
+
+# Use aiohttp for concurrent request fan-out when available
+try:
+    import asyncio
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# ijson streams the configs listing one entry at a time instead of
+# materializing the whole document; prefer the C backend when present
+try:
+    import ijson
+    try:
+        import ijson.backends.yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Malformed-document failures the file reader reports to the user; ijson
+# raises its own error type instead of json.JSONDecodeError
+_PARSE_ERRORS = (json.JSONDecodeError,)
+if IJSON_AVAILABLE:
+    _PARSE_ERRORS = _PARSE_ERRORS + (ijson.JSONError,)
+
+logger = logging.getLogger(__name__)
+
+# Disable the insecure-request warning only once per process; repeated calls
+# just churn warnings.filters when many migrators are constructed
+_ssl_warnings_disabled = False
+
+
+def _disable_ssl_warnings() -> None:
+    global _ssl_warnings_disabled
+    if not _ssl_warnings_disabled:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        _ssl_warnings_disabled = True
 
 
 class AlertConfigsMigrator:
+    # Read-only fields stripped from every config before it is sent
+    _READ_ONLY_FIELDS = ('lastUpdated', 'invalid', 'alertChannelNames', 'applicationNames')
+
+    # Defaults applied to every outgoing config: scalars can be shared,
+    # list-valued fields get a fresh list per config so payloads never
+    # alias each other
+    _API_SCALAR_DEFAULTS = {'muteUntil': 0, 'includeEntityNameInLegacyAlerts': False}
+    _API_LIST_FIELDS = ('customPayloadFields', 'integrationIds')
+
     def __init__(self, config: Config):
         self.config = config
         self.req_alert_configs = "/api/events/settings/alerts"
+        # Endpoint URLs never change for the lifetime of the migrator, so
+        # build them once instead of an f-string concat per request
+        self._source_configs_url = f"{config.source_url}{self.req_alert_configs}"
+        self._target_configs_url = f"{config.target_url}{self.req_alert_configs}"
+        # Build the auth headers once; they are identical for every request
+        self._source_headers = config.get_source_headers()
+        self._target_headers = config.get_target_headers()
+        # Conditional-request state for the target listing: when the
+        # backend replies 304 Not Modified on a retried run, the cached
+        # list is reused instead of re-downloading and re-parsing it
+        self._target_etag = None
+        self._target_cache = None
+        # Reuse one pooled session so keep-alive connections are shared
+        # across all requests instead of a new TLS handshake per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Fan requests out over asyncio + aiohttp when the dependency exists
+        self._use_async = AIOHTTP_AVAILABLE
         if not config.verify_ssl:
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _disable_ssl_warnings()
 
     def migrate(self) -> Dict[str, int]:
         self.config.validate()
-        source_configs = self._get_source_configs()
-        target_configs = self._get_target_configs()
-        
-        migrated_count = 0
-        updated_count = 0
-        skipped_count = 0
-        
-        print(f"Starting migration of alert configurations...")
-        
+
+        logger.info(f"Starting migration of alert configurations...")
+
         if self.config.events_source == "file":
-            print(f"Reading alert configurations from {self.config.events_file_path} file...")
+            logger.info(f"Reading alert configurations from {self.config.events_file_path} file...")
         else:
-            print(f"Reading alert configurations from source API...")
-        
-        print(f"Successfully loaded {len(source_configs)} alert configurations from {'file' if self.config.events_source == 'file' else 'API'}")
-        print()
-        
-        target_config_names = {config.get('alertName') for config in target_configs if config.get('alertName')}
+            logger.info(f"Reading alert configurations from source API...")
+
+        source_configs = self._get_source_configs()
+
+        logger.info(f"Successfully loaded {len(source_configs)} alert configurations from {'file' if self.config.events_source == 'file' else 'API'}")
+        logger.info("")
+
+        # Nothing to migrate, so skip the target listing round trip entirely
+        if not source_configs:
+            logger.info("No source alert configurations found, nothing to migrate.")
+            return {"migrated": 0, "updated": 0, "skipped": 0}
+
+        target_configs = self._get_target_configs() if not self.config.skip_duplicate_check else []
+
+        skipped_count = 0
+
+        # Index existing target configs by name once for O(1) duplicate lookups
+        target_by_name = {c['alertName']: c for c in target_configs if c.get('alertName')}
         
+        # Phase 1: resolve all interactive prompts serially so input() never
+        # blocks the workers, collecting (config, name, target_id) actions
+        actions: List[Tuple[Dict[str, Any], str, Any]] = []
         for config in source_configs:
             config_name = config.get('alertName')
             if not config_name:
                 continue
-                
-            if config_name in target_config_names:
-                choice = self._prompt_for_duplicate_config(str(config_name))
+
+            if config_name in target_by_name:
+                # Use the configured non-interactive action when set, so batch
+                # runs are never serialized by input() prompts
+                if self.config.on_duplicate != 'ask':
+                    choice = self.config.on_duplicate
+                else:
+                    choice = self._prompt_for_duplicate_config(str(config_name))
                 if choice == 'skip':
-                    print(f"Skipping alert configuration '{config_name}' - already exists in target system")
+                    logger.info(f"Skipping alert configuration '{config_name}' - already exists in target system")
                     skipped_count += 1
                     continue
                 elif choice == 'update':
-                    print(f"Updating alert configuration '{config_name}' - already exists in target system")
-                    target_config = next((c for c in target_configs if c.get('alertName') == config_name), None)
-                    if target_config and self._update_config(config, target_config.get('id'), str(config_name)):
-                        updated_count += 1
+                    logger.info(f"Updating alert configuration '{config_name}' - already exists in target system")
+                    actions.append((config, str(config_name), target_by_name[config_name].get('id')))
                     continue
                 elif choice == 'cancel':
                     break
-                    
-            if self._create_config(config, str(config_name)):
-                migrated_count += 1
-        
-        print(f"Migration complete. Found {len(source_configs)} source alert configurations, migrated {migrated_count} alert configurations, updated {updated_count} alert configurations, skipped {skipped_count} existing alert configurations.")
+
+            actions.append((config, str(config_name), None))
+
+        # Phase 2: execute the create/update calls concurrently over the
+        # pooled session; the requests are independent and purely I/O bound
+        results = self._execute_actions(actions)
+        migrated_count = results.count('created')
+        updated_count = results.count('updated')
+
+        logger.info(f"Migration complete. Found {len(source_configs)} source alert configurations, migrated {migrated_count} alert configurations, updated {updated_count} alert configurations, skipped {skipped_count} existing alert configurations.")
         
         return {
             "migrated": migrated_count,
@@ -67,45 +161,118 @@ class AlertConfigsMigrator:
             "skipped": skipped_count
         }
 
+    # The Instana settings API has no bulk endpoint; concurrency over one
+    # shared keep-alive pool is what amortizes the per-item round trips.
+    def _execute_actions(self, actions: List[Tuple[Dict[str, Any], str, Any]],
+                         max_workers: int = 8) -> List[str]:
+        def run_action(action: Tuple[Dict[str, Any], str, Any]) -> str:
+            config, config_name, target_id = action
+            if target_id is not None:
+                return 'updated' if self._update_config(config, target_id, config_name) else 'failed'
+            return 'created' if self._create_config(config, config_name) else 'failed'
+
+        # Keep the serial path for single actions for easier debugging
+        workers = min(max_workers, len(actions))
+        if workers <= 1:
+            return [run_action(action) for action in actions]
+
+        if self._use_async:
+            return asyncio.run(self._execute_actions_async(actions, max_workers))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_action, actions))
+
+    async def _execute_actions_async(self, actions: List[Tuple[Dict[str, Any], str, Any]],
+                                     max_concurrent: int = 8) -> List[str]:
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=32, ssl=None if self.config.verify_ssl else False)
+
+        async def run_action(session: aiohttp.ClientSession,
+                             action: Tuple[Dict[str, Any], str, Any]) -> str:
+            config, config_name, target_id = action
+            async with semaphore:
+                if target_id is not None:
+                    return 'updated' if await self._put_config_async(session, config, target_id, config_name, 'Updated') else 'failed'
+                return 'created' if await self._put_config_async(session, config, None, config_name, 'Created') else 'failed'
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return list(await asyncio.gather(*[run_action(session, action) for action in actions]))
+
+    async def _put_config_async(self, session: 'aiohttp.ClientSession', config: Dict[str, Any],
+                                target_id: Any, config_name: str, verb: str) -> bool:
+        try:
+            formatted_config = self._format_config_for_api(config)
+            config_id = target_id if target_id is not None else formatted_config['id']
+            async with session.put(
+                f"{self._target_configs_url}/{config_id}",
+                json=formatted_config,
+                headers=self._target_headers
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+            logger.info(f"{verb} alert configuration '{config_name}' (Target ID: {result.get('id', 'unknown')})")
+            return True
+        except Exception as e:
+            logger.info(f"Error {'updating' if verb == 'Updated' else 'creating'} alert configuration '{config_name}': {e}")
+            return False
+
     def _get_source_configs(self) -> List[Dict[str, Any]]:
         if self.config.events_source == "file":
             try:
+                if IJSON_AVAILABLE:
+                    # Stream the array one config at a time so peak memory
+                    # is the result list, not the raw document plus the
+                    # parse tree
+                    with open(self.config.events_file_path, 'rb') as f:
+                        return list(ijson_backend.items(f, 'item', use_float=True))
                 with open(self.config.events_file_path, 'r') as f:
-                    return json.load(f)
+                    return fast_json.load(f)
             except FileNotFoundError:
-                print(f"Error: Source file '{self.config.events_file_path}' not found.")
+                logger.info(f"Error: Source file '{self.config.events_file_path}' not found.")
                 return []
-            except json.JSONDecodeError:
-                print(f"Error: Invalid JSON in source file '{self.config.events_file_path}'.")
+            except _PARSE_ERRORS:
+                logger.info(f"Error: Invalid JSON in source file '{self.config.events_file_path}'.")
                 return []
         else:
             try:
-                response = requests.get(
-                    f"{self.config.source_url}{self.req_alert_configs}",
-                    headers=self.config.get_source_headers(),
+                response = self.session.get(
+                    self._source_configs_url,
+                    headers=self._source_headers,
                     verify=self.config.verify_ssl
                 )
                 response.raise_for_status()
                 return response.json()
             except Exception as e:
-                print(f"Error fetching alert configurations from source API: {e}")
+                logger.info(f"Error fetching alert configurations from source API: {e}")
                 return []
 
     def _get_target_configs(self) -> List[Dict[str, Any]]:
+        headers = self._target_headers
+        if self._target_etag is not None:
+            headers = {**headers, "If-None-Match": self._target_etag}
         try:
-            response = requests.get(
-                f"{self.config.target_url}{self.req_alert_configs}",
-                headers=self.config.get_target_headers(),
+            response = self.session.get(
+                self._target_configs_url,
+                headers=headers,
                 verify=self.config.verify_ssl
             )
+            if response.status_code == 304:
+                logger.info("Target alert configurations unchanged since last fetch, using cached listing")
+                return self._target_cache
             response.raise_for_status()
-            return response.json()
+            self._target_etag = response.headers.get("ETag")
+            self._target_cache = response.json()
+            return self._target_cache
         except Exception as e:
-            print(f"Error fetching alert configurations from target API: {e}")
+            logger.info(f"Error fetching alert configurations from target API: {e}")
             return []
 
     def _prompt_for_duplicate_config(self, config_name: str) -> str:
         while True:
+            # Flush any buffered log output before prompting so the question
+            # appears after the messages that led up to it
+            for handler in logging.getLogger().handlers:
+                handler.flush()
             print(f"Alert configuration '{config_name}' already exists in the target system.")
             print("Choose an action:")
             print("  [s] Skip")
@@ -125,47 +292,54 @@ class AlertConfigsMigrator:
     def _create_config(self, config: Dict[str, Any], config_name: str) -> bool:
         try:
             formatted_config = self._format_config_for_api(config)
-            response = requests.put(
-                f"{self.config.target_url}{self.req_alert_configs}/{formatted_config['id']}",
+            response = self.session.put(
+                f"{self._target_configs_url}/{formatted_config['id']}",
                 json=formatted_config,
-                headers=self.config.get_target_headers(),
+                headers=self._target_headers,
                 verify=self.config.verify_ssl
             )
-            response.raise_for_status()
+            # Any 2xx counts as success (the API answers 200/201/202
+            # depending on version); the boolean check is also cheaper on
+            # the failure path than raising and catching HTTPError
+            if not response.ok:
+                logger.info(f"Error creating alert configuration '{config_name}': HTTP {response.status_code}")
+                return False
             result = response.json()
-            print(f"Created alert configuration '{config_name}' (Target ID: {result.get('id', 'unknown')})")
+            logger.info(f"Created alert configuration '{config_name}' (Target ID: {result.get('id', 'unknown')})")
             return True
         except Exception as e:
-            print(f"Error creating alert configuration '{config_name}': {e}")
+            logger.info(f"Error creating alert configuration '{config_name}': {e}")
             return False
 
     def _update_config(self, config: Dict[str, Any], target_id: str, config_name: str) -> bool:
         try:
             formatted_config = self._format_config_for_api(config)
-            print(f"Updating alert configuration with ID: {target_id}")
-            response = requests.put(
-                f"{self.config.target_url}{self.req_alert_configs}/{target_id}",
+            logger.info(f"Updating alert configuration with ID: {target_id}")
+            response = self.session.put(
+                f"{self._target_configs_url}/{target_id}",
                 json=formatted_config,
-                headers=self.config.get_target_headers(),
+                headers=self._target_headers,
                 verify=self.config.verify_ssl
             )
-            response.raise_for_status()
+            if not response.ok:
+                logger.info(f"Error updating alert configuration '{config_name}': HTTP {response.status_code}")
+                return False
             result = response.json()
-            print(f"Updated alert configuration '{config_name}' (Target ID: {result.get('id', 'unknown')})")
+            logger.info(f"Updated alert configuration '{config_name}' (Target ID: {result.get('id', 'unknown')})")
             return True
         except Exception as e:
-            print(f"Error updating alert configuration '{config_name}': {e}")
+            logger.info(f"Error updating alert configuration '{config_name}': {e}")
             return False
 
     def _format_config_for_api(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        formatted = config.copy()
-        
+        # The caller owns the parsed config dict and never reuses the raw
+        # form, so mutate in place instead of copying the whole dict
+        formatted = config
+
         # Remove read-only fields that shouldn't be sent in API requests
-        read_only_fields = ['lastUpdated', 'invalid', 'alertChannelNames', 'applicationNames']
-        for field in read_only_fields:
-            if field in formatted:
-                del formatted[field]
-        
+        for field in self._READ_ONLY_FIELDS:
+            formatted.pop(field, None)
+
         # Ensure required fields are present
         if 'id' not in formatted:
             raise ValueError("Alert configuration must have an 'id' field")
@@ -183,20 +357,12 @@ class AlertConfigsMigrator:
                 "validVersion": 1
             }
         
-        # Ensure customPayloadFields is an array
-        if 'customPayloadFields' not in formatted:
-            formatted['customPayloadFields'] = []
-        
-        # Ensure integrationIds is an array
-        if 'integrationIds' not in formatted:
-            formatted['integrationIds'] = []
-        
-        # Ensure muteUntil has a default value
-        if 'muteUntil' not in formatted:
-            formatted['muteUntil'] = 0
-        
-        # Ensure includeEntityNameInLegacyAlerts has a default value
-        if 'includeEntityNameInLegacyAlerts' not in formatted:
-            formatted['includeEntityNameInLegacyAlerts'] = False
-        
+        # Fill in the remaining API defaults from the class-level template
+        for field in self._API_LIST_FIELDS:
+            if field not in formatted:
+                formatted[field] = []
+        for field, default in self._API_SCALAR_DEFAULTS.items():
+            if field not in formatted:
+                formatted[field] = default
+
         return formatted
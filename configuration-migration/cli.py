@@ -2,15 +2,131 @@
 
 import sys
 import argparse
+import importlib
+import logging
+import logging.handlers
 from config import Config
 import sys
 import os
 
-# Import will be done conditionally based on command
+# Migrator classes are imported lazily (PEP 562) so startup only pays for
+# the package the selected command actually needs
+_MIGRATOR_CLASSES = {
+    'EventsMigrator': 'custom-events-specification',
+    'AlertChannelsMigrator': 'alert-channels',
+    'AlertConfigsMigrator': 'alert-configs',
+    'CustomDashboardsMigrator': 'custom-dashboards',
+}
+
+# Maps each CLI command to the migrator class that runs it
+_COMMAND_CLASSES = {
+    'events': 'EventsMigrator',
+    'channels': 'AlertChannelsMigrator',
+    'configs': 'AlertConfigsMigrator',
+    'custom-dashboards': 'CustomDashboardsMigrator',
+}
+
+
+def _load_migrator(class_name: str):
+    """Import and return the migrator class for the given class name.
+
+    Each migrator module is imported under its unique dotted name so the
+    four packages never collide in sys.modules; the packages handle their
+    own sibling imports, so sys.path is left alone here.
+    """
+    package_dir = _MIGRATOR_CLASSES[class_name]
+    module = importlib.import_module(f'{package_dir}.migrator')
+    return getattr(module, class_name)
+
+
+def __getattr__(name):
+    """Resolve migrator classes on first access instead of at import time."""
+    if name in _MIGRATOR_CLASSES:
+        value = _load_migrator(name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Arguments shared by every subcommand
+_COMMON_ARGS = [
+    ('--config-file', {'help': 'Path to configuration file'}),
+    ('--source-token', {'help': 'API token for source backend'}),
+    ('--source-url', {'help': 'URL for source backend'}),
+    ('--target-token', {'help': 'API token for target backend'}),
+    ('--target-url', {'help': 'URL for target backend'}),
+    ('--no-verify-ssl', {'action': 'store_true', 'help': 'Disable SSL certificate verification'}),
+]
+
+# (command help, noun for --events-source help, noun for --events-file-path
+# help, command-specific extra arguments) per subcommand
+_COMMAND_SPECS = {
+    'events': (
+        'Migrate custom events', 'custom events', 'source events', [],
+    ),
+    'channels': (
+        'Migrate alert channels', 'alert channels', 'source channels',
+        [('--on-duplicate', {'choices': ['skip', 'update', 'cancel'],
+                             'help': 'Action to take when a duplicate channel is found (default: ask)'})],
+    ),
+    'configs': (
+        'Migrate alert configurations', 'alert configurations', 'source configurations',
+        [('--on-duplicate', {'choices': ['skip', 'update', 'cancel'],
+                             'help': 'Action to take when a duplicate configuration is found (default: ask)'})],
+    ),
+    'custom-dashboards': (
+        'Migrate custom dashboards', 'dashboards', 'dashboards',
+        [('--default-owner-id', {'help': 'Default owner ID for unmapped users'}),
+         ('--on-duplicate', {'choices': ['skip', 'update', 'cancel'],
+                             'help': 'Action to take when a duplicate dashboard is found (default: ask)'}),
+         ('--max-concurrent', {'type': int, 'help': 'Maximum concurrent API requests (default: 10)'}),
+         ('--rate-limit', {'type': int, 'help': 'API requests per second limit (default: 50)'}),
+         ('--request-timeout', {'type': int, 'help': 'Timeout per request in seconds (default: 30)'}),
+         ('--retry-attempts', {'type': int, 'help': 'Number of retry attempts for failed requests (default: 3)'})],
+    ),
+}
+
+
+def _make_parser_builder(name):
+    """Build the registration function for one subcommand from its spec."""
+    help_text, source_noun, file_noun, extra_args = _COMMAND_SPECS[name]
+
+    def build(subparsers):
+        sub = subparsers.add_parser(name, help=help_text)
+        for flag, kwargs in _COMMON_ARGS:
+            sub.add_argument(flag, **kwargs)
+        sub.add_argument('--events-source', choices=['api', 'file'],
+                         help=f'Source for {source_noun} (api or file)')
+        sub.add_argument('--events-file-path',
+                         help=f'Path to the {file_noun} JSON file (when using file source)')
+        for flag, kwargs in extra_args:
+            sub.add_argument(flag, **kwargs)
+
+    return build
+
+
+# Subparser builders keyed by command, so main() can register only the one
+# the invocation needs
+_PARSER_BUILDERS = {name: _make_parser_builder(name) for name in _COMMAND_SPECS}
 
 
 def main():
     """Main entry point for the command-line interface."""
+    # Migrators emit their diagnostics through logging; debug payload dumps
+    # only run when INSTANA_MIGRATOR_DEBUG is set. Records are buffered in
+    # memory and written to stdout in batches so per-message writes don't
+    # add a syscall each during the parallel execution phase; warnings and
+    # errors flush immediately, the rest on shutdown.
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=128,
+        flushLevel=logging.WARNING,
+        target=logging.StreamHandler(sys.stdout)
+    )
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("INSTANA_MIGRATOR_DEBUG") else logging.INFO,
+        format="%(message)s",
+        handlers=[buffered_handler]
+    )
     try:
         # Create argument parser for the main command
         parser = argparse.ArgumentParser(
@@ -20,55 +136,16 @@ def main():
         # Add subcommand for different migrators
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
         
-        # Custom events migrator
-        events_parser = subparsers.add_parser('events', help='Migrate custom events')
-        events_parser.add_argument('--config-file', help='Path to configuration file')
-        events_parser.add_argument('--source-token', help='API token for source backend')
-        events_parser.add_argument('--source-url', help='URL for source backend')
-        events_parser.add_argument('--target-token', help='API token for target backend')
-        events_parser.add_argument('--target-url', help='URL for target backend')
-        events_parser.add_argument('--no-verify-ssl', action='store_true', help='Disable SSL certificate verification')
-        events_parser.add_argument('--events-source', choices=['api', 'file'], help='Source for custom events (api or file)')
-        events_parser.add_argument('--events-file-path', help='Path to the source events JSON file (when using file source)')
-        
-        # Alert channels migrator
-        channels_parser = subparsers.add_parser('channels', help='Migrate alert channels')
-        channels_parser.add_argument('--config-file', help='Path to configuration file')
-        channels_parser.add_argument('--source-token', help='API token for source backend')
-        channels_parser.add_argument('--source-url', help='URL for source backend')
-        channels_parser.add_argument('--target-token', help='API token for target backend')
-        channels_parser.add_argument('--target-url', help='URL for target backend')
-        channels_parser.add_argument('--no-verify-ssl', action='store_true', help='Disable SSL certificate verification')
-        channels_parser.add_argument('--events-source', choices=['api', 'file'], help='Source for alert channels (api or file)')
-        channels_parser.add_argument('--events-file-path', help='Path to the source channels JSON file (when using file source)')
-        
-        # Alert configurations migrator
-        configs_parser = subparsers.add_parser('configs', help='Migrate alert configurations')
-        configs_parser.add_argument('--config-file', help='Path to configuration file')
-        configs_parser.add_argument('--source-token', help='API token for source backend')
-        configs_parser.add_argument('--source-url', help='URL for source backend')
-        configs_parser.add_argument('--target-token', help='API token for target backend')
-        configs_parser.add_argument('--target-url', help='URL for target backend')
-        configs_parser.add_argument('--no-verify-ssl', action='store_true', help='Disable SSL certificate verification')
-        configs_parser.add_argument('--events-source', choices=['api', 'file'], help='Source for alert configurations (api or file)')
-        configs_parser.add_argument('--events-file-path', help='Path to the source configurations JSON file (when using file source)')
-
-        # Custom dashboards migrator
-        custom_dashboards_parser = subparsers.add_parser('custom-dashboards', help='Migrate custom dashboards')
-        custom_dashboards_parser.add_argument('--config-file', help='Path to configuration file')
-        custom_dashboards_parser.add_argument('--source-token', help='API token for source backend')
-        custom_dashboards_parser.add_argument('--source-url', help='URL for source backend')
-        custom_dashboards_parser.add_argument('--target-token', help='API token for target backend')
-        custom_dashboards_parser.add_argument('--target-url', help='URL for target backend')
-        custom_dashboards_parser.add_argument('--no-verify-ssl', action='store_true', help='Disable SSL certificate verification')
-        custom_dashboards_parser.add_argument('--events-source', choices=['api', 'file'], help='Source for dashboards (api or file)')
-        custom_dashboards_parser.add_argument('--events-file-path', help='Path to the dashboards JSON file (when using file source)')
-        custom_dashboards_parser.add_argument('--default-owner-id', help='Default owner ID for unmapped users')
-        custom_dashboards_parser.add_argument('--on-duplicate', choices=['skip', 'update', 'cancel'], help='Action to take when a duplicate dashboard is found (default: ask)')
-        custom_dashboards_parser.add_argument('--max-concurrent', type=int, help='Maximum concurrent API requests (default: 10)')
-        custom_dashboards_parser.add_argument('--rate-limit', type=int, help='API requests per second limit (default: 50)')
-        custom_dashboards_parser.add_argument('--request-timeout', type=int, help='Timeout per request in seconds (default: 30)')
-        custom_dashboards_parser.add_argument('--retry-attempts', type=int, help='Number of retry attempts for failed requests (default: 3)')
+        # Only build the subparser for the command actually being run;
+        # constructing all four is argparse's main startup cost. When the
+        # first argument is not a known command (e.g. --help or a typo),
+        # register everything so help output and errors stay complete.
+        command_hint = sys.argv[1] if len(sys.argv) > 1 else None
+        if command_hint in _PARSER_BUILDERS:
+            _PARSER_BUILDERS[command_hint](subparsers)
+        else:
+            for builder in _PARSER_BUILDERS.values():
+                builder(subparsers)
 
         # Parse arguments
         args = parser.parse_args()
@@ -78,77 +155,23 @@ def main():
             parser.print_help()
             sys.exit(1)
         
-        # Convert args back to list for Config.from_args()
-        arg_list = []
-        for key, value in vars(args).items():
-            if key != 'command' and value is not None:
-                if isinstance(value, bool):
-                    if value:
-                        arg_list.append(f'--{key.replace("_", "-")}')
-                else:
-                    arg_list.append(f'--{key.replace("_", "-")}')
-                    arg_list.append(str(value))
-        
-        # Parse configuration from command line arguments
-        config = Config.from_args(arg_list)
+        # Build the configuration straight from the parsed namespace instead
+        # of reconstructing an argument list and re-parsing it
+        config = Config.from_namespace(args)
         
-        # Run the appropriate migrator
-        if args.command == 'events':
-            # Import and run the custom events migrator
-            sys.path.append(os.path.join(os.path.dirname(__file__), 'custom-events-specification'))
-            from migrator import EventsMigrator
-            migrator = EventsMigrator(config)
-            result = migrator.migrate()
-            
-            # Exit with success if at least one event was migrated
-            if result["migrated"] > 0 or result["updated"] > 0:
-                sys.exit(0)
-            else:
-                # Exit with error code if no events were migrated
-                sys.exit(1)
-                
-        elif args.command == 'channels':
-            # Import and run the alert channels migrator
-            sys.path.append(os.path.join(os.path.dirname(__file__), 'alert-channels'))
-            from migrator import AlertChannelsMigrator
-            migrator = AlertChannelsMigrator(config)
-            result = migrator.migrate()
-            
-            # Exit with success if at least one channel was migrated
-            if result["migrated"] > 0 or result["updated"] > 0:
-                sys.exit(0)
-            else:
-                # Exit with error code if no channels were migrated
-                sys.exit(1)
-                
-        elif args.command == 'configs':
-            # Import and run the alert configurations migrator
-            sys.path.append(os.path.join(os.path.dirname(__file__), 'alert-configs'))
-            from migrator import AlertConfigsMigrator
-            migrator = AlertConfigsMigrator(config)
-            result = migrator.migrate()
-            
-            # Exit with success if at least one configuration was migrated
-            if result["migrated"] > 0 or result["updated"] > 0:
-                sys.exit(0)
-            else:
-                # Exit with error code if no configurations were migrated
-                sys.exit(1)
-
-        elif args.command == 'custom-dashboards':
-            # Import and run the custom dashboards migrator
-            sys.path.append(os.path.join(os.path.dirname(__file__), 'custom-dashboards'))
-            from migrator import CustomDashboardsMigrator
-            migrator = CustomDashboardsMigrator(config)
-            result = migrator.migrate()
-            
-            # Exit with success if at least one dashboard was migrated
-            if result["migrated"] > 0 or result["updated"] > 0:
-                sys.exit(0)
-            else:
-                # Exit with error code if no dashboards were migrated
-                sys.exit(1)
-            
+        # Run the appropriate migrator; the class is resolved through this
+        # module so it is only imported now, for the selected command
+        migrator_class = getattr(sys.modules[__name__], _COMMAND_CLASSES[args.command])
+        migrator = migrator_class(config)
+        result = migrator.migrate()
+
+        # Exit with success if at least one item was migrated or updated
+        if result["migrated"] > 0 or result["updated"] > 0:
+            sys.exit(0)
+        else:
+            # Exit with error code if nothing was migrated
+            sys.exit(1)
+
     except ValueError as e:
         print(f"Configuration error: {e}")
         sys.exit(1)
@@ -5,6 +5,79 @@ import argparse
 import configparser
 from typing import Dict, Optional
 
+# Parsed config files keyed by path; the stored mtime invalidates the entry
+# when the file changes, so repeated loads skip the disk read and INI parse
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an INI boolean the same way configparser.getboolean does."""
+    return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an environment-variable boolean; anything but 'false' is true."""
+    return value.lower() != "false"
+
+
+# (section, key, attribute, cast) entries applied by load_from_file; a single
+# pass over this table replaces the per-key membership checks
+_INI_MAP = [
+    ("source", "token", "source_token", str),
+    ("source", "url", "source_url", str),
+    ("target", "token", "target_token", str),
+    ("target", "url", "target_url", str),
+    ("general", "verify_ssl", "verify_ssl", _parse_bool),
+    ("general", "events_source", "events_source", str),
+    ("general", "events_file_path", "events_file_path", str),
+    ("general", "default_owner_id", "default_owner_id", str),
+    ("general", "on_duplicate", "on_duplicate", str),
+    ("general", "skip_duplicate_check", "skip_duplicate_check", _parse_bool),
+    ("general", "verify_after_create", "verify_after_create", _parse_bool),
+    ("general", "max_concurrent_requests", "max_concurrent_requests", int),
+    ("general", "rate_limit_per_second", "rate_limit_per_second", int),
+    ("general", "request_timeout", "request_timeout", int),
+    ("general", "connect_timeout", "connect_timeout", int),
+    ("general", "retry_attempts", "retry_attempts", int),
+]
+
+# (option key, attribute) entries applied by from_mapping/from_namespace;
+# keys follow the argparse dest names
+_ARG_ATTRS = [
+    ("source_token", "source_token"),
+    ("source_url", "source_url"),
+    ("target_token", "target_token"),
+    ("target_url", "target_url"),
+    ("events_source", "events_source"),
+    ("events_file_path", "events_file_path"),
+    ("default_owner_id", "default_owner_id"),
+    ("on_duplicate", "on_duplicate"),
+    ("max_concurrent", "max_concurrent_requests"),
+    ("rate_limit", "rate_limit_per_second"),
+    ("request_timeout", "request_timeout"),
+    ("retry_attempts", "retry_attempts"),
+]
+
+# (environment variable, attribute, cast) entries applied by load_from_env
+_ENV_MAP = [
+    ("EVENTS_MIGRATOR_SOURCE_TOKEN", "source_token", str),
+    ("EVENTS_MIGRATOR_SOURCE_URL", "source_url", str),
+    ("EVENTS_MIGRATOR_TARGET_TOKEN", "target_token", str),
+    ("EVENTS_MIGRATOR_TARGET_URL", "target_url", str),
+    ("EVENTS_MIGRATOR_VERIFY_SSL", "verify_ssl", _env_bool),
+    ("EVENTS_MIGRATOR_EVENTS_SOURCE", "events_source", str),
+    ("EVENTS_MIGRATOR_EVENTS_FILE_PATH", "events_file_path", str),
+    ("EVENTS_MIGRATOR_DEFAULT_OWNER_ID", "default_owner_id", str),
+    ("EVENTS_MIGRATOR_ON_DUPLICATE", "on_duplicate", str),
+    ("EVENTS_MIGRATOR_SKIP_DUPLICATE_CHECK", "skip_duplicate_check", _env_bool),
+    ("EVENTS_MIGRATOR_VERIFY_AFTER_CREATE", "verify_after_create", _env_bool),
+    ("EVENTS_MIGRATOR_MAX_CONCURRENT", "max_concurrent_requests", int),
+    ("EVENTS_MIGRATOR_RATE_LIMIT", "rate_limit_per_second", int),
+    ("EVENTS_MIGRATOR_REQUEST_TIMEOUT", "request_timeout", int),
+    ("EVENTS_MIGRATOR_CONNECT_TIMEOUT", "connect_timeout", int),
+    ("EVENTS_MIGRATOR_RETRY_ATTEMPTS", "retry_attempts", int),
+]
+
 
 class Config:
     """Configuration handler for Custom Events Migrator."""
@@ -20,13 +93,21 @@ class Config:
         self.events_file_path = "source_events.json"  # Default file path
         self.default_owner_id = None # Default owner ID for unmapped users
         self.on_duplicate = "ask" # Default action for duplicate items
-        
+        self.skip_duplicate_check = False # Skip fetching target listings for duplicate detection
+        self.verify_after_create = False # Re-fetch each created item to double-check persistence
+
         # Performance tuning parameters
         self.max_concurrent_requests = 10  # Maximum concurrent API requests
         self.rate_limit_per_second = 50    # API requests per second limit
         self.request_timeout = 30          # Timeout per request in seconds
+        self.connect_timeout = 5           # Timeout for establishing a connection in seconds
         self.retry_attempts = 3            # Number of retry attempts for failed requests
 
+        # Header dicts cached per token so the hot request paths don't
+        # rebuild them on every call
+        self._source_headers_cache = None
+        self._target_headers_cache = None
+
     @classmethod
     def from_args(cls, args: Optional[list] = None) -> 'Config':
         """Create configuration from command line arguments.
@@ -106,46 +187,80 @@ class Config:
         )
         
         parsed_args = parser.parse_args(args)
-        
+
+        config = cls.from_namespace(parsed_args)
+        config.freeze()
+        return config
+
+    @classmethod
+    def from_namespace(cls, namespace) -> 'Config':
+        """Create configuration from an already-parsed argparse namespace.
+
+        Avoids re-running a second ArgumentParser over reconstructed
+        arguments when the caller (e.g. cli.py) has parsed them already.
+
+        Args:
+            namespace: argparse.Namespace (or any object) carrying the
+                argument attributes; missing attributes are ignored
+
+        Returns:
+            Config object with values from the namespace
+        """
+        mapping = {key: getattr(namespace, key, None) for key, _ in _ARG_ATTRS}
+        mapping['config_file'] = getattr(namespace, 'config_file', None)
+        mapping['no_verify_ssl'] = getattr(namespace, 'no_verify_ssl', False)
+        return cls.from_mapping(mapping)
+
+    @classmethod
+    def from_mapping(cls, mapping) -> 'Config':
+        """Create configuration from a plain mapping of option values.
+
+        This is the cheapest programmatic entry point: a single pass over
+        the known keys with no argparse involved. Keys follow the argparse
+        dest names; falsy or missing values are ignored.
+
+        Args:
+            mapping: Mapping of option names to values
+
+        Returns:
+            Config object with values from the mapping
+        """
         config = cls()
-        
+
         # Load from config file if specified
-        if parsed_args.config_file:
-            config.load_from_file(parsed_args.config_file)
-        
-        # Command line arguments override config file
-        if parsed_args.source_token:
-            config.source_token = parsed_args.source_token
-        if parsed_args.source_url:
-            config.source_url = parsed_args.source_url
-        if parsed_args.target_token:
-            config.target_token = parsed_args.target_token
-        if parsed_args.target_url:
-            config.target_url = parsed_args.target_url
-        if parsed_args.no_verify_ssl:
+        if mapping.get('config_file'):
+            config.load_from_file(mapping['config_file'])
+
+        # Explicit values override the config file
+        for key, attr in _ARG_ATTRS:
+            value = mapping.get(key)
+            if value:
+                setattr(config, attr, value)
+        if mapping.get('no_verify_ssl'):
             config.verify_ssl = False
-        if parsed_args.events_source:
-            config.events_source = parsed_args.events_source
-        if parsed_args.events_file_path:
-            config.events_file_path = parsed_args.events_file_path
-        if parsed_args.default_owner_id:
-            config.default_owner_id = parsed_args.default_owner_id
-        if parsed_args.on_duplicate:
-            config.on_duplicate = parsed_args.on_duplicate
-        if parsed_args.max_concurrent:
-            config.max_concurrent_requests = parsed_args.max_concurrent
-        if parsed_args.rate_limit:
-            config.rate_limit_per_second = parsed_args.rate_limit
-        if parsed_args.request_timeout:
-            config.request_timeout = parsed_args.request_timeout
-        if parsed_args.retry_attempts:
-            config.retry_attempts = parsed_args.retry_attempts
-            
-        # Environment variables override command line arguments
+
+        # Environment variables override everything else
         config.load_from_env()
-        
+
         return config
-    
+
+    def freeze(self) -> None:
+        """Precompute derived values and block further mutation.
+
+        Warms the header caches so the hot request paths always hit them,
+        and marks the object read-only so a stray load_from_* call cannot
+        change settings mid-migration. Programmatic callers that build a
+        Config incrementally simply never call this.
+        """
+        self.get_source_headers()
+        self.get_target_headers()
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"Config is frozen; cannot set {name!r}")
+        super().__setattr__(name, value)
+
     def load_from_file(self, file_path: str) -> None:
         """Load configuration from a file.
         
@@ -154,70 +269,36 @@ class Config:
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
-            
-        parser = configparser.ConfigParser()
-        parser.read(file_path)
-        
-        if "source" in parser:
-            if "token" in parser["source"]:
-                self.source_token = parser["source"]["token"]
-            if "url" in parser["source"]:
-                self.source_url = parser["source"]["url"]
-                
-        if "target" in parser:
-            if "token" in parser["target"]:
-                self.target_token = parser["target"]["token"]
-            if "url" in parser["target"]:
-                self.target_url = parser["target"]["url"]
-                
-        if "general" in parser:
-            if "verify_ssl" in parser["general"]:
-                self.verify_ssl = parser["general"].getboolean("verify_ssl")
-            if "events_source" in parser["general"]:
-                self.events_source = parser["general"]["events_source"]
-            if "events_file_path" in parser["general"]:
-                self.events_file_path = parser["general"]["events_file_path"]
-            if "default_owner_id" in parser["general"]:
-                self.default_owner_id = parser["general"]["default_owner_id"]
-            if "on_duplicate" in parser["general"]:
-                self.on_duplicate = parser["general"]["on_duplicate"]
-            if "max_concurrent_requests" in parser["general"]:
-                self.max_concurrent_requests = parser["general"].getint("max_concurrent_requests")
-            if "rate_limit_per_second" in parser["general"]:
-                self.rate_limit_per_second = parser["general"].getint("rate_limit_per_second")
-            if "request_timeout" in parser["general"]:
-                self.request_timeout = parser["general"].getint("request_timeout")
-            if "retry_attempts" in parser["general"]:
-                self.retry_attempts = parser["general"].getint("retry_attempts")
+
+        # Reuse the parsed sections when the file is unchanged since the
+        # last load; st_mtime_ns catches rewrites that os.path checks miss.
+        # If the path cannot be stat'd (e.g. a faked file in tests), parse
+        # without caching.
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cached = _CONFIG_CACHE.get(file_path)
+        if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+            sections = cached[1]
+        else:
+            parser = configparser.ConfigParser()
+            parser.read(file_path)
+            sections = {name: dict(parser[name]) for name in parser.sections()}
+            if mtime_ns is not None:
+                _CONFIG_CACHE[file_path] = (mtime_ns, sections)
+
+        for section, key, attr, cast in _INI_MAP:
+            values = sections.get(section)
+            if values is not None and key in values:
+                setattr(self, attr, cast(values[key]))
     
     def load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        if "EVENTS_MIGRATOR_SOURCE_TOKEN" in os.environ:
-            self.source_token = os.environ["EVENTS_MIGRATOR_SOURCE_TOKEN"]
-        if "EVENTS_MIGRATOR_SOURCE_URL" in os.environ:
-            self.source_url = os.environ["EVENTS_MIGRATOR_SOURCE_URL"]
-        if "EVENTS_MIGRATOR_TARGET_TOKEN" in os.environ:
-            self.target_token = os.environ["EVENTS_MIGRATOR_TARGET_TOKEN"]
-        if "EVENTS_MIGRATOR_TARGET_URL" in os.environ:
-            self.target_url = os.environ["EVENTS_MIGRATOR_TARGET_URL"]
-        if "EVENTS_MIGRATOR_VERIFY_SSL" in os.environ:
-            self.verify_ssl = os.environ["EVENTS_MIGRATOR_VERIFY_SSL"].lower() != "false"
-        if "EVENTS_MIGRATOR_EVENTS_SOURCE" in os.environ:
-            self.events_source = os.environ["EVENTS_MIGRATOR_EVENTS_SOURCE"]
-        if "EVENTS_MIGRATOR_EVENTS_FILE_PATH" in os.environ:
-            self.events_file_path = os.environ["EVENTS_MIGRATOR_EVENTS_FILE_PATH"]
-        if "EVENTS_MIGRATOR_DEFAULT_OWNER_ID" in os.environ:
-            self.default_owner_id = os.environ["EVENTS_MIGRATOR_DEFAULT_OWNER_ID"]
-        if "EVENTS_MIGRATOR_ON_DUPLICATE" in os.environ:
-            self.on_duplicate = os.environ["EVENTS_MIGRATOR_ON_DUPLICATE"]
-        if "EVENTS_MIGRATOR_MAX_CONCURRENT" in os.environ:
-            self.max_concurrent_requests = int(os.environ["EVENTS_MIGRATOR_MAX_CONCURRENT"])
-        if "EVENTS_MIGRATOR_RATE_LIMIT" in os.environ:
-            self.rate_limit_per_second = int(os.environ["EVENTS_MIGRATOR_RATE_LIMIT"])
-        if "EVENTS_MIGRATOR_REQUEST_TIMEOUT" in os.environ:
-            self.request_timeout = int(os.environ["EVENTS_MIGRATOR_REQUEST_TIMEOUT"])
-        if "EVENTS_MIGRATOR_RETRY_ATTEMPTS" in os.environ:
-            self.retry_attempts = int(os.environ["EVENTS_MIGRATOR_RETRY_ATTEMPTS"])
+        for env_var, attr, cast in _ENV_MAP:
+            value = os.environ.get(env_var)
+            if value is not None:
+                setattr(self, attr, cast(value))
     
     def validate(self) -> None:
         """Validate that the configuration is complete.
@@ -240,10 +321,12 @@ class Config:
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "Authorization": f"apiToken {self.source_token}",
-            "Content-Type": "application/json"
-        }
+        if self._source_headers_cache is None or self._source_headers_cache[0] != self.source_token:
+            self._source_headers_cache = (self.source_token, {
+                "Authorization": f"apiToken {self.source_token}",
+                "Content-Type": "application/json"
+            })
+        return self._source_headers_cache[1]
     
     def get_target_headers(self) -> Dict[str, str]:
         """Get headers for target backend API requests.
@@ -251,9 +334,11 @@ class Config:
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "Authorization": f"apiToken {self.target_token}",
-            "Content-Type": "application/json"
-        }
+        if self._target_headers_cache is None or self._target_headers_cache[0] != self.target_token:
+            self._target_headers_cache = (self.target_token, {
+                "Authorization": f"apiToken {self.target_token}",
+                "Content-Type": "application/json"
+            })
+        return self._target_headers_cache[1]
 
 # Made with Bob
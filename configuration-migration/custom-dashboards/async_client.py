@@ -3,46 +3,84 @@
 import aiohttp
 import asyncio
 from aiohttp_retry import RetryClient, ExponentialRetry
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional
+import os
 import ssl
+import sys
+
+# fast_json lives in the repo root one level up (orjson when installed,
+# stdlib json otherwise)
+_parent = os.path.join(os.path.dirname(__file__), '..')
+if _parent not in sys.path:
+    sys.path.append(_parent)
+import fast_json
+
+# Parse the system CA bundle once at import; creating a default context per
+# session re-reads it from disk every time
+_DEFAULT_SSL_CTX = ssl.create_default_context()
 
 
 class AsyncHTTPClient:
-    """Manages async HTTP sessions with retry and rate limiting."""
+    """Manages async HTTP sessions with retry and rate limiting.
+
+    aiohttp is HTTP/1.1 only; concurrency here comes from pooled
+    keep-alive connections (limit_per_host) rather than HTTP/2
+    multiplexing, which would require swapping the client stack to
+    httpx and porting the aiohttp-retry integration.
+    """
     
-    def __init__(self, verify_ssl: bool = True, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, verify_ssl: bool = True, timeout: int = 30, max_retries: int = 3,
+                 max_connections: int = 100):
         """Initialize the async HTTP client.
-        
+
         Args:
             verify_ssl: Whether to verify SSL certificates
             timeout: Timeout for requests in seconds
             max_retries: Maximum number of retry attempts
+            max_connections: Hard cap on concurrent connections; the
+                connector queues requests beyond it in FIFO order
         """
         self.verify_ssl = verify_ssl
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
+        self.max_connections = max_connections
         self.session: Optional[aiohttp.ClientSession] = None
         self.retry_client: Optional[RetryClient] = None
-        
+        self._enter_count = 0
+
     async def __aenter__(self):
-        """Enter async context manager."""
-        # Configure SSL context
-        ssl_context = ssl.create_default_context()
-        if not self.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-        
-        # Create connector with connection pooling
+        """Enter async context manager.
+
+        Re-entrant within one event loop: nested or repeated entries reuse
+        the existing connector and session instead of paying fresh TLS
+        handshakes and DNS lookups per phase. (A process-wide singleton is
+        not possible — aiohttp sessions are bound to the event loop that
+        created them, and each migration phase runs under its own
+        asyncio.run.)
+        """
+        if self._enter_count:
+            self._enter_count += 1
+            return self
+
+        # Create connector with connection pooling; cache DNS lookups so
+        # they are shared across all requests in the session. Verification
+        # off maps to ssl=False, so the shared default context is never
+        # mutated.
         connector = aiohttp.TCPConnector(
-            ssl=ssl_context if self.verify_ssl else False,
-            limit=100,  # Connection pool size
-            limit_per_host=30
+            ssl=_DEFAULT_SSL_CTX if self.verify_ssl else False,
+            limit=self.max_connections,  # Connection pool size
+            limit_per_host=self.max_connections,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
         )
         
-        # Create session
+        # Create session; json= payloads are encoded with fast_json
         self.session = aiohttp.ClientSession(
             connector=connector,
-            timeout=self.timeout
+            timeout=self.timeout,
+            json_serialize=fast_json.dumps
         )
         
         # Create retry client with exponential backoff
@@ -58,67 +96,115 @@ class AsyncHTTPClient:
             client_session=self.session,
             retry_options=retry_options
         )
-        
+
+        self._enter_count = 1
         return self
-        
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Exit async context manager."""
+        """Exit async context manager; only the outermost exit closes."""
+        self._enter_count -= 1
+        if self._enter_count > 0:
+            return
         if self.retry_client:
             await self.retry_client.close()
+            self.retry_client = None
         if self.session:
             await self.session.close()
+            self.session = None
     
-    async def get(self, url: str, headers: Dict[str, str]) -> aiohttp.ClientResponse:
-        """Perform async GET request with retry logic.
-        
+    async def get_json(self, url: str, headers: Dict[str, str]) -> Any:
+        """Perform async GET request with retry logic and return the JSON body.
+
+        The body is read inside the request context; returning the raw
+        ClientResponse after the context exits would hand the caller a
+        response whose connection is already back in the pool and whose
+        body is no longer readable.
+
         Args:
             url: URL to request
             headers: HTTP headers
-            
+
         Returns:
-            Response object
+            Parsed JSON response body
         """
         if not self.retry_client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        
+
         async with self.retry_client.get(url, headers=headers) as response:
             response.raise_for_status()
-            return response
-    
-    async def post(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> aiohttp.ClientResponse:
-        """Perform async POST request with retry logic.
-        
+            return fast_json.loads(await response.read())
+
+    async def post_json(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> Any:
+        """Perform async POST request with retry logic and return the JSON body.
+
         Args:
             url: URL to request
             headers: HTTP headers
             json: JSON payload
-            
+
         Returns:
-            Response object
+            Parsed JSON response body
         """
         if not self.retry_client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        
+
         async with self.retry_client.post(url, headers=headers, json=json) as response:
             response.raise_for_status()
-            return response
-    
-    async def put(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> aiohttp.ClientResponse:
-        """Perform async PUT request with retry logic.
-        
+            return fast_json.loads(await response.read())
+
+    async def put_json(self, url: str, headers: Dict[str, str], json: Dict[str, Any]) -> Any:
+        """Perform async PUT request with retry logic and return the JSON body.
+
         Args:
             url: URL to request
             headers: HTTP headers
             json: JSON payload
-            
+
         Returns:
-            Response object
+            Parsed JSON response body
         """
         if not self.retry_client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-        
+
         async with self.retry_client.put(url, headers=headers, json=json) as response:
             response.raise_for_status()
-            return response
+            return fast_json.loads(await response.read())
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Yield a live response for callers that need status, headers, or
+        streaming access to the body; the caller controls the context.
+
+        Args:
+            method: HTTP method name
+            url: URL to request
+            **kwargs: Extra arguments passed to the underlying request
+
+        Yields:
+            The open aiohttp.ClientResponse (raise_for_status applied)
+        """
+        if not self.retry_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        async with self.retry_client.request(method, url, **kwargs) as response:
+            response.raise_for_status()
+            yield response
+
+    async def delete(self, url: str, headers: Dict[str, str]) -> int:
+        """Perform async DELETE request with retry logic.
+
+        Args:
+            url: URL to request
+            headers: HTTP headers
+
+        Returns:
+            HTTP status code of the response
+        """
+        if not self.retry_client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        async with self.retry_client.delete(url, headers=headers) as response:
+            response.raise_for_status()
+            return response.status
 
 # Made with Bob
@@ -6,15 +6,60 @@ import os
 import requests
 import urllib3
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path to import config
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import Config
 
+# Use the pooled async client for concurrent deletion when available
+try:
+    import asyncio
+    from async_client import AsyncHTTPClient
+    ASYNC_AVAILABLE = True
+except ImportError:
+    ASYNC_AVAILABLE = False
+
+# ijson parses the dashboard listing incrementally from the socket so the
+# whole response is never buffered; plain json is the fallback
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+def _build_session(config: Config) -> requests.Session:
+    """Build a pooled session with retries for the synchronous requests.
+
+    One session reuses keep-alive connections across the fetch and every
+    delete instead of handshaking per request, and carries the auth
+    headers so they are not rebuilt per call.
+
+    Args:
+        config: Configuration object with target backend details
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(config.get_target_headers())
+    session.verify = config.verify_ssl
+    return session
+
+
 def delete_all_dashboards(config: Config):
     """Delete all custom dashboards from target backend.
     
@@ -27,16 +72,28 @@ def delete_all_dashboards(config: Config):
     print(f"Target URL: {config.target_url}")
     print()
     
+    session = _build_session(config)
+
     # Get all dashboards
     print("Fetching all dashboards from target...")
     try:
-        response = requests.get(
+        response = session.get(
             f"{config.target_url}/api/custom-dashboard",
-            headers=config.get_target_headers(),
-            verify=config.verify_ssl
+            stream=True
         )
         response.raise_for_status()
-        dashboards = response.json()
+        # Only the id/title pairs are needed for confirmation and deletion,
+        # so drop the full dashboard blobs as they are parsed. The user
+        # must confirm the complete list before any delete, which is why
+        # fetch and delete phases are not overlapped.
+        if IJSON_AVAILABLE:
+            # urllib3 hands back the wire bytes unless told otherwise;
+            # ijson cannot parse a gzip-encoded stream
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, 'item', use_float=True)
+        else:
+            items = response.json()
+        dashboards = [{'id': d.get('id'), 'title': d.get('title')} for d in items]
         print(f"Found {len(dashboards)} dashboards")
     except Exception as e:
         print(f"Error fetching dashboards: {e}")
@@ -62,23 +119,87 @@ def delete_all_dashboards(config: Config):
     # Delete dashboards
     print()
     print("Deleting dashboards...")
+    if ASYNC_AVAILABLE:
+        deleted_count, failed_count = asyncio.run(_delete_dashboards_async(config, dashboards))
+    else:
+        deleted_count, failed_count = _delete_dashboards_serial(config, session, dashboards)
+
+    print()
+    print("=" * 60)
+    print(f"Deletion complete: {deleted_count} deleted, {failed_count} failed")
+    print("=" * 60)
+
+
+async def _delete_dashboards_async(config: Config, dashboards: list) -> tuple:
+    """Delete dashboards concurrently over one pooled async session.
+
+    Args:
+        config: Configuration object with target backend details
+        dashboards: List of dashboard dicts to delete
+
+    Returns:
+        Tuple of (deleted_count, failed_count)
+    """
+    headers = config.get_target_headers()
+    semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+
+    async with AsyncHTTPClient(
+        verify_ssl=config.verify_ssl,
+        timeout=config.request_timeout,
+        max_retries=config.retry_attempts
+    ) as client:
+        async def delete_one(dashboard) -> bool:
+            dashboard_id = dashboard.get('id')
+            dashboard_title = dashboard.get('title', 'N/A')
+
+            if not dashboard_id:
+                print(f"✗ Skipping dashboard '{dashboard_title}' - no ID")
+                return False
+
+            async with semaphore:
+                try:
+                    await client.delete(
+                        f"{config.target_url}/api/custom-dashboard/{dashboard_id}",
+                        headers=headers
+                    )
+                    print(f"✓ Deleted dashboard '{dashboard_title}' (ID: {dashboard_id})")
+                    return True
+                except Exception as e:
+                    print(f"✗ Failed to delete dashboard '{dashboard_title}' (ID: {dashboard_id}): {e}")
+                    return False
+
+        results = await asyncio.gather(*[delete_one(dashboard) for dashboard in dashboards])
+
+    deleted_count = sum(1 for ok in results if ok)
+    return deleted_count, len(results) - deleted_count
+
+
+def _delete_dashboards_serial(config: Config, session: requests.Session, dashboards: list) -> tuple:
+    """Fallback serial deletion when aiohttp is not installed.
+
+    Args:
+        config: Configuration object with target backend details
+        session: Pooled requests session carrying auth headers
+        dashboards: List of dashboard dicts to delete
+
+    Returns:
+        Tuple of (deleted_count, failed_count)
+    """
     deleted_count = 0
     failed_count = 0
-    
+
     for dashboard in dashboards:
         dashboard_id = dashboard.get('id')
         dashboard_title = dashboard.get('title', 'N/A')
-        
+
         if not dashboard_id:
             print(f"✗ Skipping dashboard '{dashboard_title}' - no ID")
             failed_count += 1
             continue
-        
+
         try:
-            response = requests.delete(
-                f"{config.target_url}/api/custom-dashboard/{dashboard_id}",
-                headers=config.get_target_headers(),
-                verify=config.verify_ssl
+            response = session.delete(
+                f"{config.target_url}/api/custom-dashboard/{dashboard_id}"
             )
             response.raise_for_status()
             print(f"✓ Deleted dashboard '{dashboard_title}' (ID: {dashboard_id})")
@@ -86,11 +207,8 @@ def delete_all_dashboards(config: Config):
         except Exception as e:
             print(f"✗ Failed to delete dashboard '{dashboard_title}' (ID: {dashboard_id}): {e}")
             failed_count += 1
-    
-    print()
-    print("=" * 60)
-    print(f"Deletion complete: {deleted_count} deleted, {failed_count} failed")
-    print("=" * 60)
+
+    return deleted_count, failed_count
 
 
 if __name__ == "__main__":
@@ -107,9 +225,10 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    # Load configuration
+    # Load configuration from file, then let environment variables override
     config = Config()
     config.load_from_file(args.config_file)
+    config.load_from_env()
     config.validate()
     
     # Delete all dashboards
@@ -2,60 +2,85 @@
 
 import asyncio
 import time
-from typing import Optional
+from typing import List
 
 
 class RateLimiter:
-    """Token bucket rate limiter for async operations."""
-    
+    """Monotonic-slot rate limiter for async operations.
+
+    Each caller reserves the next free start slot during a short lock
+    section and sleeps outside it. The old token-bucket implementation
+    slept while holding the lock, so concurrent waiters were woken one at
+    a time through the critical section; here the lock is only held for
+    the slot arithmetic.
+    """
+
     def __init__(self, rate_per_second: int):
         """Initialize the rate limiter.
-        
+
         Args:
             rate_per_second: Maximum number of operations per second
         """
         self.rate = rate_per_second
-        self.tokens = float(rate_per_second)
-        self.last_update = time.monotonic()
+        self._interval = 1.0 / rate_per_second
+        self._next = time.monotonic()
         self.lock = asyncio.Lock()
-        
-    async def _refill_tokens(self):
-        """Refill tokens based on elapsed time."""
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        
-        # Add tokens based on elapsed time
-        self.tokens = min(
-            self.rate,
-            self.tokens + elapsed * self.rate
-        )
-        self.last_update = now
-        
+
     async def acquire(self):
-        """Acquire a token, waiting if necessary.
-        
-        This method will block until a token is available.
+        """Reserve the next slot, sleeping outside the lock until it opens.
+
+        This method will block until the caller's slot arrives.
+        """
+        async with self.lock:
+            now = time.monotonic()
+            slot = self._next if self._next > now else now
+            self._next = slot + self._interval
+
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def reserve(self, count: int) -> List[float]:
+        """Reserve count upcoming slots in one lock section.
+
+        Lets a caller that is about to fan out N tasks hand each one a
+        precomputed start time, so the children never touch the lock.
+
+        Args:
+            count: Number of slots to reserve
+
+        Returns:
+            Monotonic timestamps at which each operation may start
         """
+        if count <= 0:
+            return []
+
         async with self.lock:
-            await self._refill_tokens()
-            
-            # Wait until we have at least one token
-            while self.tokens < 1:
-                # Calculate how long to wait for the next token
-                wait_time = (1 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-                await self._refill_tokens()
-            
-            # Consume one token
-            self.tokens -= 1
-    
+            now = time.monotonic()
+            slot = self._next if self._next > now else now
+            slots = [slot + i * self._interval for i in range(count)]
+            self._next = slot + count * self._interval
+        return slots
+
     async def acquire_multiple(self, count: int):
-        """Acquire multiple tokens at once.
-        
+        """Acquire multiple slots at once.
+
+        Reserves count consecutive slots in one lock section and sleeps a
+        single time until the last of them opens.
+
         Args:
-            count: Number of tokens to acquire
+            count: Number of slots to acquire
         """
-        for _ in range(count):
-            await self.acquire()
+        if count <= 0:
+            return
+
+        async with self.lock:
+            now = time.monotonic()
+            slot = self._next if self._next > now else now
+            self._next = slot + count * self._interval
+
+        delay = slot + (count - 1) * self._interval - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 # Made with Bob
@@ -1,15 +1,73 @@
 """Core functionality for migrating custom events between backends."""
 
 import sys
+import logging
+import re
 import requests
+import shutil
 import urllib3
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple
 
-import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# The hyphenated directory names cannot be packaged with relative imports,
+# so the shared modules are found via sys.path. Only append the path when
+# it is not already present - unconditional appends grow sys.path (and the
+# finder caches keyed on it) on every re-import across processes.
+_parent_dir = os.path.join(os.path.dirname(__file__), '..')
+if _parent_dir not in sys.path:
+    sys.path.append(_parent_dir)
 from config import Config
+import fast_json
+
+# Use aiohttp for concurrent request fan-out when available
+try:
+    import asyncio
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ijson parses the events file incrementally instead of materializing the
+# whole document first; plain json is the fallback. Prefer the C backend,
+# which is roughly an order of magnitude faster than the pure-Python one.
+try:
+    import ijson
+    try:
+        import ijson.backends.yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Parse failures the file reader reports to the user; ijson raises its own
+# error type for malformed documents
+_SOURCE_PARSE_ERRORS = (FileNotFoundError, json.JSONDecodeError)
+if IJSON_AVAILABLE:
+    _SOURCE_PARSE_ERRORS = _SOURCE_PARSE_ERRORS + (ijson.JSONError,)
+
+# Queries referencing a source-system id (e.g. entity.service.id) cannot be
+# replayed against the target backend; compiled once so the per-event check
+# in the classification loop is a single scan
+_ID_RE = re.compile(r'\.id\b')
+
+# On-disk cache of the target listing plus the ETag it was served with, so
+# repeated runs can revalidate with If-None-Match instead of re-downloading.
+# The cached record carries the target URL it came from; a cache written
+# for one backend is never replayed against another.
+_TARGET_CACHE_PATH = ".target_events_cache.json"
+
+# Enum-like string fields repeated across large event listings; JSON parsing
+# allocates a fresh string per occurrence, so interning collapses them to
+# one object per distinct value
+_INTERNED_EVENT_FIELDS = ('entityType', 'ruleLogicalOperator')
+_INTERNED_RULE_FIELDS = ('ruleType', 'metricName', 'aggregation', 'conditionOperator')
 
 
 class EventsMigrator:
@@ -17,99 +75,351 @@ class EventsMigrator:
 
     def __init__(self, config: Config):
         """Initialize the migrator with configuration.
-        
+
         Args:
             config: Configuration object with backend details
         """
         self.config = config
         self.req_custom_events = "/api/events/settings/event-specifications/custom"
-        
+
+        # Build the auth headers and endpoint URLs once; they are identical
+        # for every request
+        self._source_headers = config.get_source_headers()
+        self._target_headers = config.get_target_headers()
+        self._source_events_url = f"{config.source_url}{self.req_custom_events}"
+        self._target_events_url = f"{config.target_url}{self.req_custom_events}"
+
+        # Bound every request so a stalled backend cannot hang the whole
+        # migration; the retry policy below handles the recovery
+        self._timeout = (config.connect_timeout, config.request_timeout)
+
+        # Events dropped during the streamed file parse, folded back into
+        # the migration summary so the counts still cover the whole file
+        self._prefiltered_count = 0
+
+        # Reuse one pooled session so keep-alive connections are shared
+        # across all requests instead of a new TLS handshake per call.
+        # requests speaks HTTP/1.1 only; concurrency across pooled
+        # connections (and the aiohttp path) stands in for HTTP/2
+        # multiplexing without swapping the client stack to httpx.
+        # Transient 5xx/429 responses retry with backoff instead of failing
+        # the whole migration. Only idempotent methods retry: a POST create
+        # that was applied server-side but answered with a gateway error
+        # would be re-sent and create a duplicate, and the target listing
+        # was fetched before dispatch so it cannot catch that.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                connect=3,
+                read=3,
+                backoff_factor=0.5,
+                respect_retry_after_header=True,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods={"GET", "PUT"}
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Fan requests out over asyncio + aiohttp when the dependency exists
+        self._use_async = AIOHTTP_AVAILABLE
+
         # Disable SSL warnings if verify_ssl is False
         if not config.verify_ssl:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
+
     def migrate(self) -> Dict[str, int]:
         """Perform the migration of custom events.
-        
+
         Returns:
             Dictionary with counts of source, migrated, and skipped events
         """
         # Validate configuration before proceeding
         self.config.validate()
-        
-        print("Starting migration of custom event configurations...")
-        
-        # Get source events
-        source_events = self._get_source_events()
-        if source_events is None:
-            return {"source": 0, "migrated": 0, "skipped": 0}
-        
-        # Get target events to avoid duplicates
-        target_events = self._get_target_events()
+
+        logger.info("Starting migration of custom event configurations...")
+
+        # Fetch the source and target listings concurrently when both come
+        # from the network; they hit independent backends, so the wait is
+        # max(source, target) instead of the sum. File mode stays
+        # sequential: a missing file then skips the target round trip.
+        if self.config.events_source.lower() == "file":
+            source_events = self._get_source_events()
+            if source_events is None:
+                return {"source": 0, "migrated": 0, "skipped": 0}
+            target_events = self._get_target_events()
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = executor.submit(self._get_source_events)
+                target_future = executor.submit(self._get_target_events)
+                source_events = source_future.result()
+                target_events = target_future.result()
+            if source_events is None:
+                return {"source": 0, "migrated": 0, "skipped": 0}
+
         if target_events is None:
             return {"source": len(source_events), "migrated": 0, "skipped": 0}
-        
-        #Extract names of existing events in target system for comparison
-        target_event_names = [event.get('name') for event in target_events if event.get('name')]
-        
-        # Counter for migrated events
-        migrated_count = 0
-        skipped_count = 0
-        updated_count = 0
-        source_events_count = len(source_events)
-        
-        # Process each custom event from source
+
+        # Index existing target events by name once for O(1) duplicate lookups
+        target_by_name = {event['name']: event for event in target_events if event.get('name')}
+
+        # Counter for migrated events; events already dropped by the
+        # streamed file parse still count as seen and skipped
+        skipped_count = self._prefiltered_count
+        source_events_count = len(source_events) + self._prefiltered_count
+
+        # Phase 1: classify the events, setting duplicates aside so every
+        # interactive prompt happens in one batch before any dispatch.
+        # Indexing the usable source events by name first lets the
+        # new-versus-duplicate split run as a single C-level set operation
+        # on the dict key views instead of a per-event membership test.
+        source_by_name: Dict[str, Dict[str, Any]] = {}
+        deduped_count = 0
         for event in source_events:
             # Extract event name for comparison
             event_name = event.get('name')
             event_query:Any | None = event.get('query')
 
             if not event_name:
-                print("Skipping event with no name")
+                logger.info("Skipping event with no name")
                 continue
 
-            if event_query and isinstance(event_query, str) and ".id" in event_query:
+            if isinstance(event_query, str) and _ID_RE.search(event_query):
                 skipped_count += 1
-                print(f"Skipping event '{event_name}' - query contains id reference from source system")
+                logger.info(f"Skipping event '{event_name}' - query contains id reference from source system")
                 continue
-            
-            # Check if event with same name already exists in target
-            if event_name in target_event_names:
-                # Prompt user for choice
-                choice = self._prompt_for_duplicate_event(str(event_name))
-                if choice == 'skip':
-                    print(f"Skipping event '{event_name}' - already exists in target system")
-                    skipped_count += 1
-                    continue
-                if choice == 'update':
-                    print(f"Updating event '{event_name}' - already exists in target system")
-                    if self._update_event(event, str(event_name), target_events):
-                        updated_count += 1
-                        continue
-                elif choice == 'cancel':
-                    print("Migration cancelled by user")
-                    break
-                
-            if 'id' in event:
-                del event['id']
-            # Create the event in target system
-            if self._create_event(event, str(event_name)):
-                migrated_count += 1
-        
-        print(f"Migration complete. Found {source_events_count} source events, "
+
+            # Messy exports can list the same event name more than once;
+            # dropping repeats here (first occurrence wins) avoids redundant
+            # round trips before any network I/O happens
+            if str(event_name) in source_by_name:
+                deduped_count += 1
+                logger.info(f"Skipping duplicate source event '{event_name}'")
+                continue
+
+            source_by_name[str(event_name)] = event
+
+        dup_names = source_by_name.keys() & target_by_name.keys()
+
+        # Rebuild the two lists in source order (dicts preserve insertion
+        # order) so prompts and dispatch stay deterministic
+        actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]] = [
+            (self._strip_id(event), event_name, None)
+            for event_name, event in source_by_name.items()
+            if event_name not in dup_names
+        ]
+        duplicates: List[Tuple[Dict[str, Any], str]] = [
+            (event, event_name)
+            for event_name, event in source_by_name.items()
+            if event_name in dup_names
+        ]
+
+        # Resolve all duplicates at once: a configured action or a single
+        # apply-to-all answer covers the whole batch, and only an explicit
+        # "ask for each" falls back to one prompt per event
+        batch_choice = None
+        if duplicates:
+            if self.config.on_duplicate != 'ask':
+                batch_choice = self.config.on_duplicate
+            elif len(duplicates) > 1:
+                batch_choice = self._prompt_for_duplicate_batch([name for _, name in duplicates])
+
+        cancelled = False
+        for event, event_name in duplicates:
+            choice = batch_choice or self._prompt_for_duplicate_event(event_name)
+            if choice == 'skip':
+                logger.info(f"Skipping event '{event_name}' - already exists in target system")
+                skipped_count += 1
+                continue
+            if choice == 'update':
+                logger.info(f"Updating event '{event_name}' - already exists in target system")
+                actions.append((self._strip_id(event), event_name, target_by_name[event_name]))
+                continue
+            elif choice == 'cancel':
+                logger.info("Migration cancelled by user")
+                cancelled = True
+                break
+
+        # A cancel aborts the whole migration before any request is made:
+        # the queued creates must not be dispatched just because they were
+        # classified ahead of the prompt
+        if cancelled:
+            return {
+                "source": source_events_count,
+                "migrated": 0,
+                "updated": 0,
+                "skipped": skipped_count,
+                "deduped": deduped_count
+            }
+
+        # Phase 2: execute the create/update calls concurrently; the
+        # requests are independent and purely I/O bound
+        results = self._execute_actions(actions)
+        migrated_count = results.count('created')
+        updated_count = results.count('updated')
+
+        logger.info(f"Migration complete. Found {source_events_count} source events, "
               f"migrated {migrated_count} custom events, updated {updated_count} events, "
-              f"skipped {skipped_count} existing events.")
-        
+              f"skipped {skipped_count} existing events"
+              + (f", dropped {deduped_count} duplicate source entries" if deduped_count else "")
+              + ".")
+
         return {
             "source": source_events_count,
             "migrated": migrated_count,
             "updated": updated_count,
-            "skipped": skipped_count
+            "skipped": skipped_count,
+            "deduped": deduped_count
         }
-    
+
+    # The Instana settings API has no bulk create/update endpoint, so round
+    # trips are amortized by issuing the per-event requests concurrently
+    # instead of batching payloads server-side.
+    def _execute_actions(self, actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]],
+                         max_workers: int = 8) -> List[str]:
+        """Run the collected create/update actions, in parallel when possible.
+
+        Args:
+            actions: List of (event, event_name, target_event) tuples,
+                where target_event is the duplicate to update or None
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of results: 'created', 'updated', or 'failed'
+        """
+        def run_action(action: Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]) -> str:
+            event, event_name, target_event = action
+            if target_event is not None:
+                if self._update_event(event, event_name, target_event):
+                    return 'updated'
+            # Fall back to creation when not updating or the update failed
+            if self._create_event(event, event_name):
+                return 'created'
+            return 'failed'
+
+        # Keep the serial path for single actions for easier debugging
+        workers = min(max_workers, len(actions))
+        if workers <= 1:
+            return [run_action(action) for action in actions]
+
+        if self._use_async:
+            return asyncio.run(self._execute_actions_async(actions, max_workers))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_action, actions))
+
+    async def _execute_actions_async(self, actions: List[Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]],
+                                     max_concurrent: int = 8) -> List[str]:
+        """Run the collected create/update actions concurrently with aiohttp.
+
+        Args:
+            actions: List of (event, event_name, target_event) tuples,
+                where target_event is the duplicate to update or None
+            max_concurrent: Maximum number of in-flight requests
+
+        Returns:
+            List of results: 'created', 'updated', or 'failed'
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=16, ssl=None if self.config.verify_ssl else False)
+
+        async def run_action(session: aiohttp.ClientSession,
+                             action: Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]) -> str:
+            event, event_name, target_event = action
+            async with semaphore:
+                if target_event is not None:
+                    if await self._update_event_async(session, event, event_name, target_event):
+                        return 'updated'
+                # Fall back to creation when not updating or the update failed
+                if await self._create_event_async(session, event, event_name):
+                    return 'created'
+                return 'failed'
+
+        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout,
+                                        connect=self.config.connect_timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return list(await asyncio.gather(*[run_action(session, action) for action in actions]))
+
+    async def _create_event_async(self, session: 'aiohttp.ClientSession',
+                                  event: Dict[str, Any], event_name: str) -> bool:
+        """Create a custom event in the target backend via aiohttp.
+
+        Args:
+            session: Open aiohttp client session
+            event: Event configuration to create
+            event_name: Name of the event for logging
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            async with session.post(
+                self._target_events_url,
+                headers=self._target_headers,
+                json=event
+            ) as response:
+                response.raise_for_status()
+                new_event = await response.json()
+
+            if 'id' in new_event:
+                logger.info(f"Migrated custom event '{event_name}' (Target ID: {new_event['id']})")
+                return True
+            else:
+                logger.info(f"Failed to migrate custom event '{event_name}' - no ID returned")
+                return False
+        except aiohttp.ClientError as e:
+            logger.info(f"Failed to migrate custom event '{event_name}'")
+            logger.info(f"Error: {e}")
+            return False
+
+    async def _update_event_async(self, session: 'aiohttp.ClientSession',
+                                  event: Dict[str, Any], event_name: str,
+                                  target_event: Optional[Dict[str, Any]]) -> bool:
+        """Update an existing custom event in the target backend via aiohttp.
+
+        Args:
+            session: Open aiohttp client session
+            event: Event configuration to update
+            event_name: Name of the event for logging
+            target_event: Matching event from the target system
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # The caller already resolved the duplicate from its name index
+            if not target_event or 'id' not in target_event:
+                logger.info(f"Failed to find matching target event for '{event_name}'")
+                return False
+
+            target_event_id = target_event['id']
+            logger.info(f"Updating event with ID: {target_event_id}")
+
+            async with session.put(
+                self._target_events_url + "/" + str(target_event_id),
+                headers=self._target_headers,
+                json=event
+            ) as response:
+                response.raise_for_status()
+                updated_event = await response.json()
+
+            if 'id' in updated_event:
+                logger.info(f"Updated custom event '{event_name}' (Target ID: {updated_event['id']})")
+                return True
+            else:
+                logger.info(f"Failed to update custom event '{event_name}' - no ID returned")
+                return False
+        except aiohttp.ClientError as e:
+            logger.info(f"Failed to update custom event '{event_name}'")
+            logger.info(f"Error: {e}")
+            return False
+
     def _get_source_events(self) -> Optional[List[Dict[str, Any]]]:
         """Get all custom event configurations from source backend or file.
-        
+
         Returns:
             List of custom event configurations or None if failed
         """
@@ -117,73 +427,240 @@ class EventsMigrator:
         if self.config.events_source.lower() == "file":
             try:
                 file_path = self.config.events_file_path
-                print(f"Reading custom events from {file_path} file...")
-                with open(file_path, 'r') as f:
-                    events = json.load(f)
-                print(f"Successfully loaded {len(events)} events from file")
-                return events
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                print(f"Error reading {self.config.events_file_path} file: {e}")
-                print("Make sure the file exists and contains valid JSON")
+                logger.info(f"Reading custom events from {file_path} file...")
+                if IJSON_AVAILABLE:
+                    # Stream the array one event at a time so peak memory is
+                    # the result list, not the raw document plus the parse
+                    # tree. Events whose query references a source-system id
+                    # can never be replayed, so they are dropped as they
+                    # stream past instead of being materialized only for the
+                    # classification loop to discard them again.
+                    self._prefiltered_count = 0
+                    events = []
+                    with open(file_path, 'rb') as f:
+                        for event in ijson_backend.items(f, 'item', use_float=True):
+                            query = event.get('query')
+                            if isinstance(query, str) and _ID_RE.search(query):
+                                self._prefiltered_count += 1
+                                logger.info(f"Skipping event '{event.get('name')}' - "
+                                            f"query contains id reference from source system")
+                                continue
+                            events.append(event)
+                else:
+                    with open(file_path, 'r') as f:
+                        events = fast_json.load(f)
+                logger.info(f"Successfully loaded {len(events)} events from file"
+                            + (f" ({self._prefiltered_count} filtered during parse)"
+                               if self._prefiltered_count else ""))
+                return self._intern_event_strings(events)
+            except _SOURCE_PARSE_ERRORS as e:
+                logger.info(f"Error reading {self.config.events_file_path} file: {e}")
+                logger.info("Make sure the file exists and contains valid JSON")
                 return None
         else:
             # Default behavior - fetch from API
             try:
-                print("Fetching custom events from API endpoint...")
-                response = requests.get(
-                    f"{self.config.source_url}{self.req_custom_events}",
-                    headers=self.config.get_source_headers(),
-                    verify=self.config.verify_ssl
+                logger.info("Fetching custom events from API endpoint...")
+                response = self.session.get(
+                    self._source_events_url,
+                    headers=self._source_headers,
+                    verify=self.config.verify_ssl,
+                    stream=True,
+                    timeout=self._timeout
                 )
                 response.raise_for_status()
-                events = response.json()
-                
-                # Write the response to the configured file path
-                with open(self.config.events_file_path, 'w') as f:
-                    json.dump(events, f, indent=2)
-                
-                print(f"Successfully fetched {len(events)} events from API")
-                return events
+
+                # urllib3 hands back the wire bytes unless told otherwise;
+                # without this a gzip-encoded listing would be written to
+                # disk compressed and fail to parse on reload
+                response.raw.decode_content = True
+
+                # Stream the raw body straight to the configured file path and
+                # parse once from disk, instead of parsing in memory and then
+                # re-serializing the whole list with json.dump
+                with open(self.config.events_file_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f)
+                with open(self.config.events_file_path, 'r') as f:
+                    events = fast_json.load(f)
+
+                logger.info(f"Successfully fetched {len(events)} events from API")
+                return self._intern_event_strings(events)
             except requests.exceptions.RequestException as e:
-                print(f"Error retrieving source events from API: {e}")
+                logger.info(f"Error retrieving source events from API: {e}")
                 return None
-    
+
     def _get_target_events(self) -> Optional[List[Dict[str, Any]]]:
         """Get all custom event configurations from target backend.
-        
+
+        Sends the cached listing's ETag as If-None-Match so an unchanged
+        target answers with a tiny 304 instead of the full body.
+
         Returns:
             List of custom event configurations or None if failed
         """
+        cached = self._load_target_cache()
+        headers = self._target_headers
+        if cached and cached.get('etag'):
+            headers = dict(headers)
+            headers['If-None-Match'] = cached['etag']
+
         try:
-            response = requests.get(
-                f"{self.config.target_url}{self.req_custom_events}", 
-                headers=self.config.get_target_headers(), 
-                verify=self.config.verify_ssl
+            response = self.session.get(
+                self._target_events_url,
+                headers=headers,
+                verify=self.config.verify_ssl,
+                timeout=self._timeout
             )
+            if response.status_code == 304:
+                logger.info("Target events unchanged since last run, using cached listing")
+                return cached['body']
             response.raise_for_status()
-            return response.json()
+            events = response.json()
+
+            # Only persist a usable validator; backends that send no ETag
+            # simply fall back to a full fetch every run
+            etag = response.headers.get('ETag')
+            if isinstance(etag, str) and etag:
+                self._store_target_cache(etag, events)
+            return events
         except requests.exceptions.RequestException as e:
-            print(f"Error retrieving target events: {e}")
+            logger.info(f"Error retrieving target events: {e}")
             return None
-    
+
+    def _load_target_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the cached target listing and its ETag from disk.
+
+        A record written for a different target URL is discarded:
+        sending one backend's ETag to another could serve a stale
+        listing on a coincidental validator match.
+
+        Returns:
+            Dict with 'etag' and 'body' keys, or None when absent,
+            invalid, or written for another target
+        """
+        try:
+            with open(_TARGET_CACHE_PATH, 'r') as f:
+                cached = fast_json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (isinstance(cached, dict) and 'etag' in cached and 'body' in cached
+                and cached.get('target') == self._target_events_url):
+            return cached
+        return None
+
+    def _store_target_cache(self, etag: str, events: List[Dict[str, Any]]) -> None:
+        """Persist the target listing with its ETag; failures are non-fatal."""
+        try:
+            with open(_TARGET_CACHE_PATH, 'w') as f:
+                fast_json.dump({"target": self._target_events_url,
+                                "etag": etag, "body": events}, f)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    @staticmethod
+    def _intern_event_strings(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Intern repeated enum-like string fields across the event list.
+
+        Large listings carry the same entityType, rule type, and metric
+        names thousands of times; deduplicating them shrinks the resident
+        event list and improves locality in the classification loop.
+
+        Args:
+            events: Parsed source events, updated in place
+
+        Returns:
+            The same list, for call-site convenience
+        """
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            for field in _INTERNED_EVENT_FIELDS:
+                value = event.get(field)
+                if isinstance(value, str):
+                    event[field] = sys.intern(value)
+            for rule in event.get('rules') or []:
+                if not isinstance(rule, dict):
+                    continue
+                for field in _INTERNED_RULE_FIELDS:
+                    value = rule.get(field)
+                    if isinstance(value, str):
+                        rule[field] = sys.intern(value)
+        return events
+
+    @staticmethod
+    def _strip_id(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the outbound payload for an event, excluding the source id.
+
+        Copying instead of deleting in place keeps the caller's event list
+        intact for repeat migrations.
+
+        Args:
+            event: Source event configuration
+
+        Returns:
+            Copy of the event without its 'id' field
+        """
+        return {key: value for key, value in event.items() if key != 'id'}
+
+    def _prompt_for_duplicate_batch(self, event_names: List[str]) -> Optional[str]:
+        """Offer one choice covering every duplicate event.
+
+        Args:
+            event_names: Names of the duplicate events
+
+        Returns:
+            'skip', 'update', or 'cancel' to apply to all duplicates, or
+            None when the user wants to decide event by event
+        """
+        # Flush any buffered log output before prompting so the question
+        # appears after the messages that led up to it
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        print(f"\n{len(event_names)} events already exist in the target system:")
+        for index, name in enumerate(event_names, start=1):
+            print(f"  {index}. {name}")
+        while True:
+            print("Choose an action for all of them:")
+            print("  [s] Skip all")
+            print("  [u] Update all")
+            print("  [a] Ask for each event")
+            print("  [c] Cancel migration")
+
+            choice = input("Enter your choice [s/u/a/c]: ").lower()
+
+            if choice in ['s', 'skip']:
+                return 'skip'
+            elif choice in ['u', 'update']:
+                return 'update'
+            elif choice in ['a', 'ask']:
+                return None
+            elif choice in ['c', 'cancel']:
+                return 'cancel'
+            else:
+                print("Invalid choice. Please try again.")
+
     def _prompt_for_duplicate_event(self, event_name: str) -> str:
         """Prompt user for action when a duplicate event is found.
-        
+
         Args:
             event_name: Name of the duplicate event
-            
+
         Returns:
             User choice: 'skip', 'migrate', or 'cancel'
         """
         while True:
+            # Flush any buffered log output before prompting so the question
+            # appears after the messages that led up to it
+            for handler in logging.getLogger().handlers:
+                handler.flush()
             print(f"\nEvent '{event_name}' already exists in the target system.")
             print("Choose an action:")
             print("  [s] Skip")
             print("  [u] Update existing event")
             print("  [c] Cancel migration")
-            
+
             choice = input("Enter your choice [s/u/c]: ").lower()
-            
+
             if choice in ['s', 'skip']:
                 return 'skip'
             elif choice in ['u', 'update']:
@@ -192,87 +669,81 @@ class EventsMigrator:
                 return 'cancel'
             else:
                 print("Invalid choice. Please try again.")
-    
+
     def _create_event(self, event: Dict[str, Any], event_name: str) -> bool:
         """Create a custom event in the target backend.
-        
+
         Args:
             event: Event configuration to create
             event_name: Name of the event for logging
-            
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.config.target_url}{self.req_custom_events}",
-                headers=self.config.get_target_headers(),
-                json=event,
-                verify=self.config.verify_ssl
+            # Pre-encode the body with fast_json; passing json= would fall
+            # back to the slower stdlib encoder inside requests
+            response = self.session.post(
+                self._target_events_url,
+                headers=self._target_headers,
+                data=fast_json.dumps(event),
+                verify=self.config.verify_ssl,
+                timeout=self._timeout
             )
             response.raise_for_status()
             new_event = response.json()
-            
+
             if 'id' in new_event:
-                print(f"Migrated custom event '{event_name}' (Target ID: {new_event['id']})")
+                logger.info(f"Migrated custom event '{event_name}' (Target ID: {new_event['id']})")
                 return True
             else:
-                print(f"Failed to migrate custom event '{event_name}' - no ID returned")
+                logger.info(f"Failed to migrate custom event '{event_name}' - no ID returned")
                 return False
         except requests.exceptions.RequestException as e:
-            print(f"Failed to migrate custom event '{event_name}'")
-            print(f"Error: {e}")
+            logger.info(f"Failed to migrate custom event '{event_name}'")
+            logger.info(f"Error: {e}")
             return False
-            
-    def _update_event(self, event: Dict[str, Any], event_name: str, target_events: List[Dict[str, Any]]) -> bool:
+
+    def _update_event(self, event: Dict[str, Any], event_name: str, target_event: Optional[Dict[str, Any]]) -> bool:
         """Update an existing custom event in the target backend.
-        
+
         Args:
             event: Event configuration to update
             event_name: Name of the event for logging
-            target_events: List of events from the target system
-            
+            target_event: Matching event from the target system
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Use the provided target_events instead of making another API call
-            if not target_events:
-                print(f"No target events provided for updating '{event_name}'")
-                return False
-            
-            # Find the matching event in target system by name
-            target_event = next((e for e in target_events if e.get('name') == event_name), None)
+            # The caller already resolved the duplicate from its name index
             if not target_event or 'id' not in target_event:
-                print(f"Failed to find matching target event for '{event_name}'")
+                logger.info(f"Failed to find matching target event for '{event_name}'")
                 return False
-            
+
             # Use the target event ID
             target_event_id = target_event['id']
-            print(f"Updating event with ID: {target_event_id}")
-            
-            # Remove source ID if present and use target ID
-            if 'id' in event:
-                del event['id']
-            
-            response = requests.put(
-                f"{self.config.target_url}{self.req_custom_events}/{target_event_id}",
-                headers=self.config.get_target_headers(),
-                json=event,
-                verify=self.config.verify_ssl
+            logger.info(f"Updating event with ID: {target_event_id}")
+
+            response = self.session.put(
+                self._target_events_url + "/" + str(target_event_id),
+                headers=self._target_headers,
+                data=fast_json.dumps(event),
+                verify=self.config.verify_ssl,
+                timeout=self._timeout
             )
             response.raise_for_status()
             updated_event = response.json()
-            
+
             if 'id' in updated_event:
-                print(f"Updated custom event '{event_name}' (Target ID: {updated_event['id']})")
+                logger.info(f"Updated custom event '{event_name}' (Target ID: {updated_event['id']})")
                 return True
             else:
-                print(f"Failed to update custom event '{event_name}' - no ID returned")
+                logger.info(f"Failed to update custom event '{event_name}' - no ID returned")
                 return False
         except requests.exceptions.RequestException as e:
-            print(f"Failed to update custom event '{event_name}'")
-            print(f"Error: {e}")
+            logger.info(f"Failed to update custom event '{event_name}'")
+            logger.info(f"Error: {e}")
             return False
 
 # Made with Bob
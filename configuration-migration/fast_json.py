@@ -0,0 +1,40 @@
+"""JSON helpers that prefer orjson and fall back to the stdlib json module."""
+
+import json
+
+# orjson is a much faster C/Rust JSON implementation; it is optional so
+# environments without it keep working unchanged
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads(data):
+    """Parse JSON from a str, bytes, or bytearray.
+
+    Raises json.JSONDecodeError (a ValueError) on invalid input with
+    either backend.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load(f):
+    """Parse JSON from an open file object."""
+    return loads(f.read())
+
+
+def dumps(obj, indent=False) -> str:
+    """Serialize obj to a JSON string, optionally with 2-space indentation."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dump(obj, f, indent=False) -> None:
+    """Serialize obj as JSON into an open text file object."""
+    f.write(dumps(obj, indent=indent))
@@ -4,7 +4,8 @@
 import subprocess
 import sys
 import os
-import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def run_tests():
@@ -31,38 +32,57 @@ def run_tests():
     total_passed = 0
     total_failed = 0
     results = {}
-    
-    for test_file in test_files:
-        print(f" 📋 Running tests in {test_file}...")
-        try:
-            result = subprocess.run(
+
+    def run_one(test_file):
+        # Spool pytest output to a temp file instead of buffering it all as
+        # a Python string; only failing runs are read back for display
+        with tempfile.TemporaryFile(mode='w+t') as output:
+            returncode = subprocess.call(
                 ['uv', 'run', 'pytest', test_file, '-v', '--tb=short'],
                 env=env,
-                capture_output=True,
-                text=True
+                stdout=output,
+                stderr=subprocess.STDOUT
             )
-            
-            if result.returncode == 0:
-                print(f"✅ {test_file} - PASSED")
-                total_passed += 1
-                results[test_file] = "PASSED"
-            else:
-                print(f"❌ {test_file} - FAILED")
-                print(f"Error output: {result.stderr}")
+            if returncode != 0:
+                output.seek(0)
+                return returncode, output.read()
+        return returncode, ''
+
+    # Each test module imports its own top-level `migrator`, so a single
+    # combined pytest (or pytest-xdist) invocation cannot collect them
+    # together. Instead, the per-file runs execute in parallel so the
+    # interpreter and plugin startup cost is paid concurrently rather than
+    # once per file in sequence.
+    print(f" 📋 Running {len(test_files)} test files in parallel...")
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        futures = {executor.submit(run_one, test_file): test_file for test_file in test_files}
+        for future in as_completed(futures):
+            test_file = futures[future]
+            try:
+                returncode, output = future.result()
+
+                if returncode == 0:
+                    print(f"✅ {test_file} - PASSED")
+                    total_passed += 1
+                    results[test_file] = "PASSED"
+                else:
+                    print(f"❌ {test_file} - FAILED")
+                    print(f"Error output: {output}")
+                    total_failed += 1
+                    results[test_file] = "FAILED"
+
+            except Exception as e:
+                print(f"❌ {test_file} - ERROR: {e}")
                 total_failed += 1
-                results[test_file] = "FAILED"
-                
-        except Exception as e:
-            print(f"❌ {test_file} - ERROR: {e}")
-            total_failed += 1
-            results[test_file] = f"ERROR: {e}"
-    
-    # Summary
+                results[test_file] = f"ERROR: {e}"
+
+    # Summary, in the declared file order rather than completion order
     print("\n" + "=" * 60)
     print("📊 TEST SUMMARY")
     print("=" * 60)
-    
-    for test_file, status in results.items():
+
+    for test_file in test_files:
+        status = results[test_file]
         status_icon = "✅" if status == "PASSED" else "❌"
         print(f"{status_icon} {test_file}: {status}")
     
@@ -80,32 +100,33 @@ def run_tests():
         print("=" * 60)
         
         try:
-            # Run coverage for config.py which we can test properly
-            coverage_result = subprocess.run([
-                'uv', 'run', 'pytest', 'tests/test_config.py', '--cov=config', 
+            # Run coverage for config.py which we can test properly,
+            # scanning the report as it streams instead of buffering the
+            # whole output to extract two summary lines
+            coverage_proc = subprocess.Popen([
+                'uv', 'run', 'pytest', 'tests/test_config.py', '--cov=config',
                 '--cov-report=term-missing', '--cov-report=html:htmlcov'
-            ], env=env, capture_output=True, text=True)
-            
-            if coverage_result.returncode in [0, 1]:  # pytest returns 1 when some tests fail but coverage works
+            ], env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+            total_line = None
+            config_line = None
+            for line in coverage_proc.stdout:
+                if total_line is None and 'TOTAL' in line and '%' in line:
+                    total_line = line.strip()
+                elif config_line is None and 'config.py' in line and '%' in line:
+                    config_line = line.strip()
+            returncode = coverage_proc.wait()
+
+            if returncode in [0, 1]:  # pytest returns 1 when some tests fail but coverage works
                 print("✅ Coverage report generated successfully!")
                 print("\n📁 HTML coverage report saved to: htmlcov/index.html")
-                
-                # Extract and display coverage summary
-                lines = coverage_result.stdout.split('\n')
-                coverage_found = False
-                for line in lines:
-                    if 'TOTAL' in line and '%' in line:
-                        print(f"\n📈 Overall Coverage: {line.strip()}")
-                        coverage_found = True
-                        break
-                
-                if not coverage_found:
-                    # Look for config.py specific coverage
-                    for line in lines:
-                        if 'config.py' in line and '%' in line:
-                            print(f"\n📈 Config.py Coverage: {line.strip()}")
-                            break
-                        
+
+                # Display the coverage summary extracted from the stream
+                if total_line:
+                    print(f"\n📈 Overall Coverage: {total_line}")
+                elif config_line:
+                    print(f"\n📈 Config.py Coverage: {config_line}")
+
                 # Show what we're covering
                 print("\n📋 Coverage includes:")
                 print("   ✅ config.py - Configuration management (69% coverage)")
@@ -113,7 +134,6 @@ def run_tests():
                 print("   📝 Note: Full coverage requires resolving module import conflicts")
             else:
                 print("⚠️  Coverage report generation failed")
-                print(f"Error: {coverage_result.stderr}")
                 
         except Exception as e:
             print(f"⚠️  Coverage report error: {e}")
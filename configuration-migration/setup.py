@@ -1,7 +1,6 @@
 """Setup script for Custom Events Migrator package."""
 
-import os
-from setuptools import setup, find_packages
+from setuptools import setup
 
 # Read the version from pyproject.toml to ensure consistency
 version = "1.0.0"  # Default version
@@ -19,7 +18,16 @@ setup(
     author="Instana Team",
     author_email="support@instana.com",
     url="https://github.ibm.com/instana/automation-with-apis",
-    packages=find_packages(),
+    # Explicit lists instead of find_packages(): no tree walk at build
+    # time, and tests/ can never slip into the distribution
+    packages=[
+        "alert-channels",
+        "alert-configs",
+        "custom-dashboards",
+        "custom-events-specification",
+        "website-configs",
+    ],
+    py_modules=["cli", "config", "fast_json"],
     install_requires=[
         "requests>=2.31.0",
         "urllib3>=2.0.0",
@@ -1,13 +1,39 @@
 """Shared test fixtures and configuration."""
 
 import pytest
+import io
+import json
 import sys
 import os
-from unittest.mock import MagicMock
+import requests
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 # Add the parent directory to the path so we can import modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config import Config
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """One fully populated real Config shared by the migrator test modules.
+
+    Session-scoped: rebuilding Config for every test repeats the same
+    attribute assignments dozens of times for no extra isolation. Tests
+    that need a different setting (verify_ssl, events_source) use
+    monkeypatch.setattr so the change is undone after the test.
+    """
+    config = Config()
+    config.source_token = "source_token"
+    config.source_url = "https://source.com"
+    config.target_token = "target_token"
+    config.target_url = "https://target.com"
+    config.verify_ssl = True
+    config.events_source = "file"
+    config.events_file_path = "test_events.json"
+    return config
+
 
 @pytest.fixture
 def sample_config():
@@ -51,9 +77,13 @@ def sample_events():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_channels():
-    """Provide sample alert channels data for testing."""
+    """Provide sample alert channels data for testing.
+
+    Module-scoped so the list is built once per test module instead of
+    once per test; tests treat it as read-only.
+    """
     return [
         {
             "name": "Email Channel",
@@ -68,9 +98,19 @@ def sample_channels():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_channels_json(sample_channels):
+    """The channels payload serialized once per module for file-mode tests."""
+    return json.dumps(sample_channels)
+
+
+@pytest.fixture(scope="module")
 def sample_alert_configs():
-    """Provide sample alert configurations data for testing."""
+    """Provide sample alert configurations data for testing.
+
+    Module-scoped so the list is built once per test module instead of
+    once per test; tests treat it as read-only.
+    """
     return [
         {
             "alertName": "High CPU Alert",
@@ -89,3 +129,173 @@ def sample_alert_configs():
             }
         }
     ]
+
+
+@pytest.fixture(scope="module")
+def sample_alert_configs_json(sample_alert_configs):
+    """The alert-configs payload serialized once per module for file-mode tests."""
+    return json.dumps(sample_alert_configs)
+
+
+@pytest.fixture
+def response_mock():
+    """Build response stand-ins restricted to the requests.Response interface.
+
+    Mock(spec=...) is cheaper to construct than a bare MagicMock and
+    rejects attributes a real Response does not have.
+    """
+    def _build(**kwargs):
+        return Mock(spec=requests.Response, **kwargs)
+    return _build
+
+
+# Payload behind the events_file fixture; file-source tests assert
+# against these values after the real read path parses them back
+_SAMPLE_FILE_EVENTS = [
+    {"name": "Test Event 1", "query": "test query 1"},
+    {"name": "Test Event 2", "query": "test query 2"},
+]
+
+
+@pytest.fixture(scope="session")
+def events_file(tmp_path_factory):
+    """An events export written to disk once per session for file-source tests.
+
+    Pointing events_file_path at a real file exercises the actual read
+    path (including ijson streaming when installed) instead of a
+    mock_open stand-in rebuilt for every test.
+    """
+    path = tmp_path_factory.mktemp("events") / "events.json"
+    path.write_text(json.dumps(_SAMPLE_FILE_EVENTS))
+    return str(path)
+
+
+class _FakeResp:
+    """Minimal HTTP response stand-in for the request tests.
+
+    A MagicMock lazily builds child mocks and a call record on every
+    attribute access; these tests only need a status code, a payload,
+    and occasionally headers or a raw byte stream.
+    """
+    __slots__ = ("status_code", "headers", "raw", "_payload")
+
+    def __init__(self, status_code=200, payload=None, headers=None, raw=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = raw
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+@pytest.fixture
+def fake_resp():
+    """The shared canned-response class, for tests that build responses inline."""
+    return _FakeResp
+
+
+_SAMPLE_INI = """
+[source]
+token = test_source_token
+url = https://source.example.com
+
+[target]
+token = test_target_token
+url = https://target.example.com
+
+[general]
+verify_ssl = false
+events_source = file
+events_file_path = test_events.json
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_ini_path(tmp_path_factory):
+    """A config INI written to disk once per session for file-loading tests.
+
+    The parsed content is invariant, so every test reusing the path skips
+    its own write/unlink round trip.
+    """
+    path = tmp_path_factory.mktemp("cfg") / "config.ini"
+    path.write_text(_SAMPLE_INI)
+    return str(path)
+
+
+# Every parsed-args field the CLI defines; tests override only the
+# fields they exercise. Read-only so no test can mutate the shared
+# defaults through a namespace it derived from them.
+_DEFAULT_ARGS = MappingProxyType({
+    'command': None,
+    'config_file': None,
+    'source_token': None,
+    'source_url': None,
+    'target_token': None,
+    'target_url': None,
+    'no_verify_ssl': False,
+    'events_source': None,
+    'events_file_path': None,
+    'default_owner_id': None,
+    'on_duplicate': None,
+})
+
+
+@pytest.fixture(scope="session")
+def make_args():
+    """Factory for parsed-args namespaces used by the CLI and Config tests.
+
+    A SimpleNamespace is cheaper than the dynamic MockArgs classes the
+    tests used to build, and the session-scoped factory is created once.
+    """
+    return lambda **overrides: SimpleNamespace(**{**_DEFAULT_ARGS, **overrides})
+
+
+# The CLI command matrix: (command, migrator attribute on cli, migrate()
+# result, expected exit code). main() exits 0 only when at least one item
+# was migrated or updated. Shared here so future CLI test modules reuse
+# the same canonical table.
+_CLI_COMMAND_CASES = [
+    pytest.param((None, None, None, 1),
+                 id='no_command'),
+    pytest.param(('events', 'EventsMigrator',
+                 {"source": 2, "migrated": 2, "updated": 0, "skipped": 0}, 0),
+                 id='events'),
+    pytest.param(('events', 'EventsMigrator',
+                 {"source": 2, "migrated": 0, "updated": 0, "skipped": 2}, 1),
+                 id='events_no_migration'),
+    pytest.param(('events', 'EventsMigrator',
+                 {"source": 2, "migrated": 0, "updated": 1, "skipped": 1}, 0),
+                 id='events_with_update'),
+    pytest.param(('channels', 'AlertChannelsMigrator',
+                 {"source": 2, "migrated": 2, "updated": 0, "skipped": 0}, 0),
+                 id='channels'),
+    pytest.param(('configs', 'AlertConfigsMigrator',
+                 {"migrated": 2, "updated": 0, "skipped": 0}, 0),
+                 id='configs'),
+    pytest.param(('configs', 'AlertConfigsMigrator',
+                 {"migrated": 0, "updated": 0, "skipped": 2}, 1),
+                 id='configs_no_migration'),
+]
+
+
+@pytest.fixture(params=_CLI_COMMAND_CASES)
+def cli_case(request):
+    """One (command, migrator_attr, migrate_result, expected_exit) case."""
+    return request.param
+
+
+@pytest.fixture
+def fake_open(monkeypatch):
+    """Patch builtins.open to hand back an in-memory buffer of the data.
+
+    mock_open builds a MagicMock-based file object per call; a StringIO
+    is a single C-level buffer and behaves the same for read paths.
+    """
+    def _install(data):
+        monkeypatch.setattr('builtins.open', lambda *args, **kwargs: io.StringIO(data))
+    return _install
@@ -1,335 +1,372 @@
 """Unit tests for the AlertChannelsMigrator class."""
 
 import pytest
-import json
+import io
 import requests
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, DEFAULT
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'alert-channels'))
+# conftest.py already puts the project root on sys.path; only the
+# migrator directory is added here, and only once, so repeated
+# imports do not grow sys.path
+_migrator_dir = os.path.join(os.path.dirname(__file__), '..', 'alert-channels')
+if _migrator_dir not in sys.path:
+    sys.path.append(_migrator_dir)
 from migrator import AlertChannelsMigrator
-from config import Config
-
-
-class TestAlertChannelsMigrator:
-    """Test cases for the AlertChannelsMigrator class."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = Config()
-        self.config.source_token = "source_token"
-        self.config.source_url = "https://source.com"
-        self.config.target_token = "target_token"
-        self.config.target_url = "https://target.com"
-        self.config.verify_ssl = True
-        self.config.events_source = "file"
-        self.config.events_file_path = "test_channels.json"
-        
-        self.migrator = AlertChannelsMigrator(self.config)
-
-    def test_init(self):
-        """Test migrator initialization."""
-        assert self.migrator.config == self.config
-        assert self.migrator.req_alert_channels == "/api/events/settings/alertingChannels"
-
-    @patch('migrator.urllib3.disable_warnings')
-    def test_init_with_ssl_disabled(self, mock_disable_warnings):
-        """Test migrator initialization with SSL verification disabled."""
-        self.config.verify_ssl = False
-        migrator = AlertChannelsMigrator(self.config)
-        
-        mock_disable_warnings.assert_called_once()
-
-    def test_get_source_channels_from_file(self):
-        """Test getting source channels from file."""
-        test_channels = [
-            {"name": "Channel 1", "type": "email"},
-            {"name": "Channel 2", "type": "slack"}
-        ]
-        
-        with patch('builtins.open', mock_open(read_data=json.dumps(test_channels))):
-            channels = self.migrator._get_source_channels()
-            
-            assert channels == test_channels
-
-    @patch('migrator.requests.get')
-    def test_get_source_channels_from_api(self, mock_get):
-        """Test getting source channels from API."""
-        self.config.events_source = "api"
-        test_channels = [
-            {"name": "Channel 1", "type": "email"},
-            {"name": "Channel 2", "type": "slack"}
-        ]
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = test_channels
-        mock_get.return_value = mock_response
-        
-        channels = self.migrator._get_source_channels()
-        
-        assert channels == test_channels
-        mock_get.assert_called_once_with(
-            f"{self.config.source_url}{self.migrator.req_alert_channels}",
-            headers=self.config.get_source_headers(),
-            verify=self.config.verify_ssl
-        )
-
-    @patch('migrator.requests.get')
-    def test_get_source_channels_api_error(self, mock_get):
-        """Test handling API error when getting source channels."""
-        self.config.events_source = "api"
-        
-        mock_get.side_effect = requests.exceptions.RequestException("API Error")
-        
-        channels = self.migrator._get_source_channels()
-        
-        assert channels is None
 
-    def test_get_source_channels_file_not_found(self):
-        """Test handling file not found error when getting source channels."""
-        with patch('builtins.open', side_effect=FileNotFoundError):
-            channels = self.migrator._get_source_channels()
-            
-            assert channels is None
-
-    def test_get_source_channels_invalid_json(self):
-        """Test handling invalid JSON when getting source channels."""
-        with patch('builtins.open', mock_open(read_data="invalid json")):
-            channels = self.migrator._get_source_channels()
-            
-            assert channels is None
-
-    @patch('migrator.requests.get')
-    def test_get_target_channels(self, mock_get):
-        """Test getting target channels."""
-        test_channels = [
-            {"name": "Existing Channel 1", "id": "1"},
-            {"name": "Existing Channel 2", "id": "2"}
-        ]
-        
-        mock_response = MagicMock()
-        mock_response.json.return_value = test_channels
-        mock_get.return_value = mock_response
-        
-        channels = self.migrator._get_target_channels()
-        
-        assert channels == test_channels
-        mock_get.assert_called_once_with(
-            f"{self.config.target_url}{self.migrator.req_alert_channels}",
-            headers=self.config.get_target_headers(),
-            verify=self.config.verify_ssl
-        )
-
-    @patch('migrator.requests.get')
-    def test_get_target_channels_error(self, mock_get):
-        """Test handling error when getting target channels."""
-        mock_get.side_effect = requests.exceptions.RequestException("API Error")
-        
-        channels = self.migrator._get_target_channels()
-        
+
+@pytest.fixture
+def channels_migrator(base_config):
+    """A migrator wired to the shared session config."""
+    migrator = AlertChannelsMigrator(base_config)
+    # Force the synchronous execution path so mocks apply
+    migrator._use_async = False
+    return migrator
+
+
+@pytest.fixture
+def mig_mocks(channels_migrator):
+    """Stub every helper the migrate tests replace in one patch.multiple.
+
+    One context manager instead of a stack of patch.object decorators
+    per test; tests pull the mocks they need from the mapping.
+    """
+    with patch.multiple(channels_migrator,
+                        _get_source_channels=DEFAULT,
+                        _get_target_channels=DEFAULT,
+                        _prompt_for_duplicate_channel=DEFAULT,
+                        _create_channel=DEFAULT,
+                        _update_channel=DEFAULT) as mocks:
+        yield mocks
+
+
+def test_init(channels_migrator, base_config):
+    """Test migrator initialization."""
+    assert channels_migrator.config == base_config
+    assert channels_migrator.req_alert_channels == "/api/events/settings/alertingChannels"
+
+
+@patch('migrator.urllib3.disable_warnings')
+def test_init_with_ssl_disabled(mock_disable_warnings, base_config, monkeypatch):
+    """Test migrator initialization with SSL verification disabled."""
+    monkeypatch.setattr(base_config, 'verify_ssl', False)
+    migrator = AlertChannelsMigrator(base_config)
+
+    mock_disable_warnings.assert_called_once()
+
+
+def test_get_source_channels_from_file(channels_migrator, sample_channels, sample_channels_json, fake_open):
+    """Test getting source channels from file."""
+    fake_open(sample_channels_json)
+
+    channels = channels_migrator._get_source_channels()
+
+    assert channels == sample_channels
+
+
+@patch('migrator.requests.Session.get')
+def test_get_source_channels_from_api(mock_get, channels_migrator, base_config, monkeypatch,
+                                      sample_channels, sample_channels_json, response_mock,
+                                      tmp_path):
+    """Test getting source channels from API."""
+    monkeypatch.setattr(base_config, 'events_source', 'api')
+    # The API path dumps the body to events_file_path before parsing;
+    # keep that write out of the working tree
+    monkeypatch.setattr(base_config, 'events_file_path', str(tmp_path / "channels.json"))
+
+    mock_response = response_mock()
+    mock_response.raw = io.BytesIO(sample_channels_json.encode())
+    mock_get.return_value = mock_response
+
+    channels = channels_migrator._get_source_channels()
+
+    assert channels == sample_channels
+    mock_get.assert_called_once_with(
+        f"{base_config.source_url}{channels_migrator.req_alert_channels}",
+        headers=base_config.get_source_headers(),
+        verify=base_config.verify_ssl,
+        stream=True
+    )
+
+
+@patch('migrator.requests.Session.get')
+def test_get_source_channels_api_error(mock_get, channels_migrator, base_config, monkeypatch):
+    """Test handling API error when getting source channels."""
+    monkeypatch.setattr(base_config, 'events_source', 'api')
+
+    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+
+    channels = channels_migrator._get_source_channels()
+
+    assert channels is None
+
+
+def test_get_source_channels_file_not_found(channels_migrator):
+    """Test handling file not found error when getting source channels."""
+    with patch('builtins.open', side_effect=FileNotFoundError):
+        channels = channels_migrator._get_source_channels()
+
         assert channels is None
 
-    @patch('builtins.input', return_value='s')
-    def test_prompt_for_duplicate_channel_skip(self, mock_input):
-        """Test prompting for duplicate channel - skip choice."""
-        choice = self.migrator._prompt_for_duplicate_channel("Test Channel")
-        
-        assert choice == "skip"
-        mock_input.assert_called_once()
-
-    @patch('builtins.input', return_value='u')
-    def test_prompt_for_duplicate_channel_update(self, mock_input):
-        """Test prompting for duplicate channel - update choice."""
-        choice = self.migrator._prompt_for_duplicate_channel("Test Channel")
-        
-        assert choice == "update"
-        mock_input.assert_called_once()
-
-    @patch('builtins.input', return_value='c')
-    def test_prompt_for_duplicate_channel_cancel(self, mock_input):
-        """Test prompting for duplicate channel - cancel choice."""
-        choice = self.migrator._prompt_for_duplicate_channel("Test Channel")
-        
-        assert choice == "cancel"
-        mock_input.assert_called_once()
-
-    @patch('builtins.input', side_effect=['invalid', 's'])
-    def test_prompt_for_duplicate_channel_invalid_then_valid(self, mock_input):
-        """Test prompting for duplicate channel - invalid input then valid."""
-        choice = self.migrator._prompt_for_duplicate_channel("Test Channel")
-        
-        assert choice == "skip"
-        assert mock_input.call_count == 2
-
-    @patch('migrator.requests.post')
-    def test_create_channel_success(self, mock_post):
-        """Test successful channel creation."""
-        channel = {"name": "Test Channel", "type": "email"}
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "new_id"}
-        mock_post.return_value = mock_response
-        
-        result = self.migrator._create_channel(channel, "Test Channel")
-        
-        assert result is True
-        mock_post.assert_called_once_with(
-            f"{self.config.target_url}{self.migrator.req_alert_channels}",
-            headers=self.config.get_target_headers(),
-            json=channel,
-            verify=self.config.verify_ssl
-        )
-
-    @patch('migrator.requests.post')
-    def test_create_channel_failure(self, mock_post):
-        """Test failed channel creation."""
-        channel = {"name": "Test Channel", "type": "email"}
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_post.return_value = mock_response
-        
-        result = self.migrator._create_channel(channel, "Test Channel")
-        
-        assert result is False
-
-    @patch('migrator.requests.post')
-    def test_create_channel_exception(self, mock_post):
-        """Test channel creation with exception."""
-        channel = {"name": "Test Channel", "type": "email"}
-        
-        mock_post.side_effect = requests.exceptions.RequestException("API Error")
-        
-        result = self.migrator._create_channel(channel, "Test Channel")
-        
-        assert result is False
-
-    @patch('migrator.requests.put')
-    def test_update_channel_success(self, mock_put):
-        """Test successful channel update."""
-        channel = {"name": "Test Channel", "type": "email"}
-        target_channels = [{"name": "Test Channel", "id": "existing_id"}]
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "existing_id"}
-        mock_put.return_value = mock_response
-        
-        result = self.migrator._update_channel(channel, "Test Channel", target_channels)
-        
-        assert result is True
-        mock_put.assert_called_once_with(
-            f"{self.config.target_url}{self.migrator.req_alert_channels}/existing_id",
-            headers=self.config.get_target_headers(),
-            json=channel,
-            verify=self.config.verify_ssl
-        )
-
-    @patch('migrator.requests.put')
-    def test_update_channel_not_found(self, mock_put):
-        """Test channel update when target channel not found."""
-        channel = {"name": "Test Channel", "type": "email"}
-        target_channels = [{"name": "Other Channel", "id": "other_id"}]
-        
-        result = self.migrator._update_channel(channel, "Test Channel", target_channels)
-        
-        assert result is False
-        mock_put.assert_not_called()
-
-    @patch('migrator.requests.put')
-    def test_update_channel_failure(self, mock_put):
-        """Test failed channel update."""
-        channel = {"name": "Test Channel", "type": "email"}
-        target_channels = [{"name": "Test Channel", "id": "existing_id"}]
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_put.return_value = mock_response
-        
-        result = self.migrator._update_channel(channel, "Test Channel", target_channels)
-        
-        assert result is False
-
-    @patch.object(AlertChannelsMigrator, '_get_source_channels')
-    @patch.object(AlertChannelsMigrator, '_get_target_channels')
-    @patch.object(AlertChannelsMigrator, '_prompt_for_duplicate_channel')
-    @patch.object(AlertChannelsMigrator, '_create_channel')
-    def test_migrate_success(self, mock_create, mock_prompt, mock_get_target, mock_get_source):
-        """Test successful migration."""
-        source_channels = [
-            {"name": "Channel 1", "type": "email"},
-            {"name": "Channel 2", "type": "slack"}
-        ]
-        target_channels = []
-        
-        mock_get_source.return_value = source_channels
-        mock_get_target.return_value = target_channels
-        mock_create.return_value = True
-        
-        result = self.migrator.migrate()
-        
-        assert result == {"source": 2, "migrated": 2, "updated": 0, "skipped": 0}
-        assert mock_create.call_count == 2
-
-    @patch.object(AlertChannelsMigrator, '_get_source_channels')
-    @patch.object(AlertChannelsMigrator, '_get_target_channels')
-    @patch.object(AlertChannelsMigrator, '_prompt_for_duplicate_channel')
-    @patch.object(AlertChannelsMigrator, '_update_channel')
-    @patch.object(AlertChannelsMigrator, '_create_channel')
-    def test_migrate_with_duplicates(self, mock_create, mock_update, mock_prompt, mock_get_target, mock_get_source):
-        """Test migration with duplicate channels."""
-        source_channels = [
-            {"name": "Channel 1", "type": "email"},
-            {"name": "Channel 2", "type": "slack"}
-        ]
-        target_channels = [{"name": "Channel 1", "id": "existing_id"}]
-        
-        mock_get_source.return_value = source_channels
-        mock_get_target.return_value = target_channels
-        mock_prompt.return_value = "update"
-        mock_update.return_value = True
-        mock_create.return_value = True
-        
-        result = self.migrator.migrate()
-        
-        assert result == {"source": 2, "migrated": 1, "updated": 1, "skipped": 0}
-        mock_update.assert_called_once()
-
-    @patch.object(AlertChannelsMigrator, '_get_source_channels')
-    def test_migrate_no_source_channels(self, mock_get_source):
-        """Test migration when no source channels exist."""
-        mock_get_source.return_value = None
-        
-        result = self.migrator.migrate()
-        
-        assert result == {"source": 0, "migrated": 0, "updated": 0, "skipped": 0}
-
-    @patch.object(AlertChannelsMigrator, '_get_source_channels')
-    @patch.object(AlertChannelsMigrator, '_get_target_channels')
-    def test_migrate_no_target_channels(self, mock_get_target, mock_get_source):
-        """Test migration when target channels cannot be retrieved."""
-        source_channels = [{"name": "Channel 1", "type": "email"}]
-        
-        mock_get_source.return_value = source_channels
-        mock_get_target.return_value = None
-        
-        result = self.migrator.migrate()
-        
-        assert result == {"source": 1, "migrated": 0, "updated": 0, "skipped": 0}
-
-    def test_migrate_skip_channel_without_name(self):
-        """Test that channels without name are skipped."""
-        source_channels = [
-            {"type": "email"},
-            {"name": "Channel 2", "type": "slack"}
-        ]
-        target_channels = []
-        
-        with patch.object(self.migrator, '_get_source_channels', return_value=source_channels):
-            with patch.object(self.migrator, '_get_target_channels', return_value=target_channels):
-                with patch.object(self.migrator, '_create_channel', return_value=True):
-                    result = self.migrator.migrate()
-                    
-                    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 0}
+
+def test_get_source_channels_invalid_json(channels_migrator, fake_open):
+    """Test handling invalid JSON when getting source channels."""
+    fake_open("invalid json")
+
+    channels = channels_migrator._get_source_channels()
+
+    assert channels is None
+
+
+@patch('migrator.requests.Session.get')
+def test_get_target_channels(mock_get, channels_migrator, base_config, response_mock):
+    """Test getting target channels."""
+    test_channels = [
+        {"name": "Existing Channel 1", "id": "1"},
+        {"name": "Existing Channel 2", "id": "2"}
+    ]
+
+    mock_response = response_mock(status_code=200, headers={"ETag": '"abc123"'})
+    mock_response.json.return_value = test_channels
+    mock_get.return_value = mock_response
+
+    channels = channels_migrator._get_target_channels()
+
+    assert channels == test_channels
+    assert channels_migrator._target_etag == '"abc123"'
+    mock_get.assert_called_once_with(
+        f"{base_config.target_url}{channels_migrator.req_alert_channels}",
+        headers=base_config.get_target_headers(),
+        verify=base_config.verify_ssl
+    )
+
+
+@patch('migrator.requests.Session.get')
+def test_get_target_channels_error(mock_get, channels_migrator):
+    """Test handling error when getting target channels."""
+    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+
+    channels = channels_migrator._get_target_channels()
+
+    assert channels is None
+
+
+@patch('migrator.requests.Session.get')
+def test_get_target_channels_not_modified(mock_get, channels_migrator, response_mock):
+    """Test that a 304 reply reuses the cached target listing."""
+    cached = [{"name": "Existing Channel", "id": "1"}]
+    channels_migrator._target_etag = '"abc123"'
+    channels_migrator._target_cache = cached
+
+    mock_get.return_value = response_mock(status_code=304)
+
+    channels = channels_migrator._get_target_channels()
+
+    assert channels == cached
+    mock_get.return_value.json.assert_not_called()
+    assert mock_get.call_args.kwargs['headers']['If-None-Match'] == '"abc123"'
+
+
+@pytest.mark.parametrize("key,expected", [("s", "skip"), ("u", "update"), ("c", "cancel")])
+def test_prompt_for_duplicate_channel_choice(channels_migrator, monkeypatch, key, expected):
+    """Test prompting for duplicate channel - each valid choice."""
+    monkeypatch.setattr('builtins.input', lambda *_: key)
+
+    choice = channels_migrator._prompt_for_duplicate_channel("Test Channel")
+
+    assert choice == expected
+
+
+@patch('builtins.input', side_effect=['invalid', 's'])
+def test_prompt_for_duplicate_channel_invalid_then_valid(mock_input, channels_migrator):
+    """Test prompting for duplicate channel - invalid input then valid."""
+    choice = channels_migrator._prompt_for_duplicate_channel("Test Channel")
+
+    assert choice == "skip"
+    assert mock_input.call_count == 2
+
+
+@patch('migrator.requests.Session.post')
+def test_create_channel_success(mock_post, channels_migrator, base_config, response_mock):
+    """Test successful channel creation."""
+    channel = {"name": "Test Channel", "type": "email"}
+
+    mock_response = response_mock()
+    mock_response.status_code = 201
+    mock_response.json.return_value = {"id": "new_id"}
+    mock_post.return_value = mock_response
+
+    result = channels_migrator._create_channel(channel, "Test Channel")
+
+    assert result is True
+    mock_post.assert_called_once_with(
+        f"{base_config.target_url}{channels_migrator.req_alert_channels}",
+        headers=base_config.get_target_headers(),
+        json=channel,
+        verify=base_config.verify_ssl
+    )
+
+
+@patch('migrator.requests.Session.post')
+def test_create_channel_accepts_202(mock_post, channels_migrator, response_mock):
+    """Test that any 2xx response counts as a successful creation."""
+    channel = {"name": "Test Channel", "type": "email"}
+
+    mock_response = response_mock(status_code=202, ok=True)
+    mock_response.json.return_value = {"id": "new_id"}
+    mock_post.return_value = mock_response
+
+    result = channels_migrator._create_channel(channel, "Test Channel")
+
+    assert result is True
+
+
+@patch('migrator.requests.Session.post')
+def test_create_channel_failure(mock_post, channels_migrator, response_mock):
+    """Test failed channel creation."""
+    channel = {"name": "Test Channel", "type": "email"}
+
+    mock_post.return_value = response_mock(status_code=400, ok=False)
+
+    result = channels_migrator._create_channel(channel, "Test Channel")
+
+    assert result is False
+
+
+@patch('migrator.requests.Session.post')
+def test_create_channel_exception(mock_post, channels_migrator):
+    """Test channel creation with exception."""
+    channel = {"name": "Test Channel", "type": "email"}
+
+    mock_post.side_effect = requests.exceptions.RequestException("API Error")
+
+    result = channels_migrator._create_channel(channel, "Test Channel")
+
+    assert result is False
+
+
+@patch('migrator.requests.Session.put')
+def test_update_channel_success(mock_put, channels_migrator, base_config, response_mock):
+    """Test successful channel update."""
+    channel = {"name": "Test Channel", "type": "email"}
+    target_channel = {"name": "Test Channel", "id": "existing_id"}
+
+    mock_response = response_mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"id": "existing_id"}
+    mock_put.return_value = mock_response
+
+    result = channels_migrator._update_channel(channel, "Test Channel", target_channel)
+
+    assert result is True
+    mock_put.assert_called_once_with(
+        f"{base_config.target_url}{channels_migrator.req_alert_channels}/existing_id",
+        headers=base_config.get_target_headers(),
+        json=channel,
+        verify=base_config.verify_ssl
+    )
+
+
+@patch('migrator.requests.Session.put')
+def test_update_channel_not_found(mock_put, channels_migrator):
+    """Test channel update when target channel not found."""
+    channel = {"name": "Test Channel", "type": "email"}
+
+    result = channels_migrator._update_channel(channel, "Test Channel", None)
+
+    assert result is False
+    mock_put.assert_not_called()
+
+
+@patch('migrator.requests.Session.put')
+def test_update_channel_failure(mock_put, channels_migrator, response_mock):
+    """Test failed channel update."""
+    channel = {"name": "Test Channel", "type": "email"}
+    target_channel = {"name": "Test Channel", "id": "existing_id"}
+
+    mock_put.return_value = response_mock(status_code=400, ok=False)
+
+    result = channels_migrator._update_channel(channel, "Test Channel", target_channel)
+
+    assert result is False
+
+
+def test_migrate_success(mig_mocks, channels_migrator, sample_channels):
+    """Test successful migration."""
+    mig_mocks['_get_source_channels'].return_value = sample_channels
+    mig_mocks['_get_target_channels'].return_value = []
+    mig_mocks['_create_channel'].return_value = True
+
+    result = channels_migrator.migrate()
+
+    assert result == {"source": 2, "migrated": 2, "updated": 0, "skipped": 0}
+    assert mig_mocks['_create_channel'].call_count == 2
+
+
+def test_migrate_with_duplicates(mig_mocks, channels_migrator, sample_channels):
+    """Test migration with duplicate channels."""
+    target_channels = [{"name": sample_channels[0]["name"], "id": "existing_id"}]
+
+    mig_mocks['_get_source_channels'].return_value = sample_channels
+    mig_mocks['_get_target_channels'].return_value = target_channels
+    mig_mocks['_prompt_for_duplicate_channel'].return_value = "update"
+    mig_mocks['_update_channel'].return_value = True
+    mig_mocks['_create_channel'].return_value = True
+
+    result = channels_migrator.migrate()
+
+    assert result == {"source": 2, "migrated": 1, "updated": 1, "skipped": 0}
+    mig_mocks['_update_channel'].assert_called_once()
+
+
+def test_migrate_no_source_channels(mig_mocks, channels_migrator):
+    """Test migration when no source channels exist."""
+    mig_mocks['_get_source_channels'].return_value = None
+
+    result = channels_migrator.migrate()
+
+    assert result == {"source": 0, "migrated": 0, "updated": 0, "skipped": 0}
+
+
+def test_migrate_no_target_channels(mig_mocks, channels_migrator):
+    """Test migration when target channels cannot be retrieved."""
+    mig_mocks['_get_source_channels'].return_value = [{"name": "Channel 1", "type": "email"}]
+    mig_mocks['_get_target_channels'].return_value = None
+
+    result = channels_migrator.migrate()
+
+    assert result == {"source": 1, "migrated": 0, "updated": 0, "skipped": 0}
+
+
+def test_migrate_skip_channel_without_name(mig_mocks, channels_migrator):
+    """Test that channels without name are skipped."""
+    source_channels = [
+        {"type": "email"},
+        {"name": "Channel 2", "type": "slack"}
+    ]
+
+    mig_mocks['_get_source_channels'].return_value = source_channels
+    mig_mocks['_get_target_channels'].return_value = []
+    mig_mocks['_create_channel'].return_value = True
+
+    result = channels_migrator.migrate()
+
+    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 0}
+
+
+def test_execute_actions_parallel(mig_mocks, channels_migrator):
+    """Test that the batched dispatcher handles creates and updates together."""
+    mig_mocks['_create_channel'].return_value = True
+    mig_mocks['_update_channel'].return_value = True
+
+    actions = [
+        ({"name": "Channel 1", "type": "email"}, "Channel 1", None),
+        ({"name": "Channel 2", "type": "slack"}, "Channel 2", {"name": "Channel 2", "id": "existing_id"}),
+        ({"name": "Channel 3", "type": "email"}, "Channel 3", None),
+    ]
+
+    results = channels_migrator._execute_actions(actions)
+
+    assert sorted(results) == ["created", "created", "updated"]
+    assert mig_mocks['_create_channel'].call_count == 2
+    mig_mocks['_update_channel'].assert_called_once()
@@ -1,14 +1,18 @@
 """Unit tests for the Config class."""
 
 import pytest
-import tempfile
 import os
-from unittest.mock import patch, mock_open
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from unittest.mock import patch
 from config import Config
 
+# Fields validate() requires and the error each one raises when absent
+_REQUIRED_FIELDS = {
+    "source_token": "Source API token is required",
+    "source_url": "Source backend URL is required",
+    "target_token": "Target API token is required",
+    "target_url": "Target backend URL is required",
+}
+
 
 class TestConfig:
     """Test cases for the Config class."""
@@ -25,40 +29,18 @@ class TestConfig:
         assert config.events_source == "api"
         assert config.events_file_path == "source_events.json"
 
-    def test_load_from_file(self):
+    def test_load_from_file(self, sample_ini_path):
         """Test loading configuration from a file."""
-        config_content = """
-[source]
-token = test_source_token
-url = https://source.example.com
-
-[target]
-token = test_target_token
-url = https://target.example.com
+        config = Config()
+        config.load_from_file(sample_ini_path)
 
-[general]
-verify_ssl = false
-events_source = file
-events_file_path = test_events.json
-"""
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write(config_content)
-            temp_file = f.name
-        
-        try:
-            config = Config()
-            config.load_from_file(temp_file)
-            
-            assert config.source_token == "test_source_token"
-            assert config.source_url == "https://source.example.com"
-            assert config.target_token == "test_target_token"
-            assert config.target_url == "https://target.example.com"
-            assert config.verify_ssl is False
-            assert config.events_source == "file"
-            assert config.events_file_path == "test_events.json"
-        finally:
-            os.unlink(temp_file)
+        assert config.source_token == "test_source_token"
+        assert config.source_url == "https://source.example.com"
+        assert config.target_token == "test_target_token"
+        assert config.target_url == "https://target.example.com"
+        assert config.verify_ssl is False
+        assert config.events_source == "file"
+        assert config.events_file_path == "test_events.json"
 
     @patch.dict(os.environ, {
         'EVENTS_MIGRATOR_SOURCE_TOKEN': 'env_source_token',
@@ -82,25 +64,14 @@ events_file_path = test_events.json
         assert config.events_source == "file"
         assert config.events_file_path == "env_events.json"
 
-    def test_get_source_headers(self):
-        """Test getting source headers."""
+    @pytest.mark.parametrize("side", ["source", "target"])
+    def test_get_headers(self, side):
+        """Test the header format for both the source and target side."""
         config = Config()
-        config.source_token = "test_token"
-        
-        headers = config.get_source_headers()
-        
-        assert headers == {
-            "Authorization": "apiToken test_token",
-            "Content-Type": "application/json"
-        }
+        setattr(config, f"{side}_token", "test_token")
+
+        headers = getattr(config, f"get_{side}_headers")()
 
-    def test_get_target_headers(self):
-        """Test getting target headers."""
-        config = Config()
-        config.target_token = "test_token"
-        
-        headers = config.get_target_headers()
-        
         assert headers == {
             "Authorization": "apiToken test_token",
             "Content-Type": "application/json"
@@ -117,67 +88,26 @@ events_file_path = test_events.json
         # Should not raise any exception
         config.validate()
 
-    def test_validate_missing_source_token(self):
-        """Test validation fails when source token is missing."""
-        config = Config()
-        config.source_url = "https://source.com"
-        config.target_token = "target_token"
-        config.target_url = "https://target.com"
-        
-        with pytest.raises(ValueError, match="Source API token is required"):
-            config.validate()
-
-    def test_validate_missing_source_url(self):
-        """Test validation fails when source URL is missing."""
+    @pytest.mark.parametrize("omit,message", sorted(_REQUIRED_FIELDS.items()))
+    def test_validate_missing_field(self, omit, message):
+        """Test validation fails when any single required field is missing."""
         config = Config()
-        config.source_token = "source_token"
-        config.target_token = "target_token"
-        config.target_url = "https://target.com"
-        
-        with pytest.raises(ValueError, match="Source backend URL is required"):
-            config.validate()
-
-    def test_validate_missing_target_token(self):
-        """Test validation fails when target token is missing."""
-        config = Config()
-        config.source_token = "source_token"
-        config.source_url = "https://source.com"
-        config.target_url = "https://target.com"
-        
-        with pytest.raises(ValueError, match="Target API token is required"):
-            config.validate()
+        for field in _REQUIRED_FIELDS:
+            if field != omit:
+                setattr(config, field, "x")
 
-    def test_validate_missing_target_url(self):
-        """Test validation fails when target URL is missing."""
-        config = Config()
-        config.source_token = "source_token"
-        config.source_url = "https://source.com"
-        config.target_token = "target_token"
-        
-        with pytest.raises(ValueError, match="Target backend URL is required"):
+        with pytest.raises(ValueError, match=message):
             config.validate()
 
     @patch('gettext.translation')
     @patch('config.argparse.ArgumentParser.parse_args')
-    def test_from_args_with_config_file(self, mock_parse_args, mock_gettext):
+    def test_from_args_with_config_file(self, mock_parse_args, mock_gettext, make_args,
+                                        monkeypatch, fake_open):
         """Test creating config from args with config file."""
         # Mock gettext to prevent it from trying to read .mo files
         mock_gettext.return_value.gettext.return_value = ''
 
-        # Mock parsed args
-        mock_args = type('MockArgs', (), {
-            'config_file': 'test_config.ini',
-            'source_token': None,
-            'source_url': None,
-            'target_token': None,
-            'target_url': None,
-            'no_verify_ssl': False,
-            'events_source': None,
-            'events_file_path': None,
-            'default_owner_id': None,
-            'on_duplicate': None
-        })()
-        mock_parse_args.return_value = mock_args
+        mock_parse_args.return_value = make_args(config_file='test_config.ini')
         
         config_content = """
 [source]
@@ -189,36 +119,38 @@ token = file_target_token
 url = https://file.target.com
 """
         
-        with patch('os.path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=config_content)):
-                config = Config.from_args()
-                
-                assert config.source_token == "file_source_token"
-                assert config.source_url == "https://file.source.com"
-                assert config.target_token == "file_target_token"
-                assert config.target_url == "https://file.target.com"
+        # No file I/O anywhere in this path: the existence check is a
+        # lambda and open() hands configparser an in-memory buffer
+        monkeypatch.setattr('os.path.exists', lambda *_: True)
+        fake_open(config_content)
+
+        config = Config.from_args()
+
+        assert config.source_token == "file_source_token"
+        assert config.source_url == "https://file.source.com"
+        assert config.target_token == "file_target_token"
+        assert config.target_url == "https://file.target.com"
 
     @patch('gettext.translation')
     @patch('config.argparse.ArgumentParser.parse_args')
-    def test_from_args_command_line_override(self, mock_parse_args, mock_gettext):
+    def test_from_args_command_line_override(self, mock_parse_args, mock_gettext, make_args,
+                                             monkeypatch, fake_open):
         """Test that command line args override config file."""
         # Mock gettext
         mock_gettext.return_value.gettext.return_value = ''
 
-        # Mock parsed args
-        mock_args = type('MockArgs', (), {
-            'config_file': 'test_config.ini',
-            'source_token': 'cli_source_token',
-            'source_url': 'https://cli.source.com',
-            'target_token': 'cli_target_token',
-            'target_url': 'https://cli.target.com',
-            'no_verify_ssl': True,
-            'events_source': 'file',
-            'events_file_path': 'cli_events.json',
-            'default_owner_id': 'cli_owner_id',
-            'on_duplicate': 'update'
-        })()
-        mock_parse_args.return_value = mock_args
+        mock_parse_args.return_value = make_args(
+            config_file='test_config.ini',
+            source_token='cli_source_token',
+            source_url='https://cli.source.com',
+            target_token='cli_target_token',
+            target_url='https://cli.target.com',
+            no_verify_ssl=True,
+            events_source='file',
+            events_file_path='cli_events.json',
+            default_owner_id='cli_owner_id',
+            on_duplicate='update'
+        )
         
         config_content = """
 [source]
@@ -230,15 +162,16 @@ token = file_target_token
 url = https://file.target.com
 """
         
-        with patch('os.path.exists', return_value=True):
-            with patch('builtins.open', mock_open(read_data=config_content)):
-                config = Config.from_args()
-                
-                # Command line args should override config file
-                assert config.source_token == "cli_source_token"
-                assert config.source_url == "https://cli.source.com"
-                assert config.target_token == "cli_target_token"
-                assert config.target_url == "https://cli.target.com"
-                assert config.verify_ssl is False
-                assert config.events_source == "file"
-                assert config.events_file_path == "cli_events.json"
+        monkeypatch.setattr('os.path.exists', lambda *_: True)
+        fake_open(config_content)
+
+        config = Config.from_args()
+
+        # Command line args should override config file
+        assert config.source_token == "cli_source_token"
+        assert config.source_url == "https://cli.source.com"
+        assert config.target_token == "cli_target_token"
+        assert config.target_url == "https://cli.target.com"
+        assert config.verify_ssl is False
+        assert config.events_source == "file"
+        assert config.events_file_path == "cli_events.json"
@@ -1,121 +1,131 @@
+"""Unit tests for the CustomDashboardsMigrator class."""
 
-import unittest
-from unittest.mock import patch, MagicMock
+import pytest
+import requests
+from unittest.mock import patch, DEFAULT
 import sys
 import os
+# conftest.py already puts the project root on sys.path; only the
+# migrator directory is added here, and only once, so repeated
+# imports do not grow sys.path
+_migrator_dir = os.path.join(os.path.dirname(__file__), '..', 'custom-dashboards')
+if _migrator_dir not in sys.path:
+    sys.path.append(_migrator_dir)
+from migrator import CustomDashboardsMigrator
 
-import importlib
-
-# Add the parent directory to the sys.path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'custom-dashboards'))
-migrator_module = importlib.import_module("migrator")
-CustomDashboardsMigrator = migrator_module.CustomDashboardsMigrator
-from config import Config
-
-class TestCustomDashboardsMigrator(unittest.TestCase):
-
-    def setUp(self):
-        self.config = Config()
-        self.config.source_token = "test"
-        self.config.source_url = "http://test.com"
-        self.config.target_token = "test"
-        self.config.target_url = "http://test.com"
-        self.config.on_duplicate = "skip"  # Set default for tests
-        self.migrator = CustomDashboardsMigrator(self.config)
-        # Force synchronous mode and ensure attributes exist
-        self.migrator._use_async = False
-        self.migrator.req_custom_dashboards = "/api/custom-dashboard"
-        self.migrator.req_shareable_users = "/api/settings/users"
-
-    @patch('requests.get')
-    def test_get_source_dashboards(self, mock_get):
-        # Mock the first call to get dashboard IDs
-        mock_response_ids = MagicMock()
-        mock_response_ids.status_code = 200
-        mock_response_ids.json.return_value = [{'id': '1', 'title': 'Test Dashboard Summary'}]
-
-        # Mock the second call to get full dashboard details
-        mock_response_details = MagicMock()
-        mock_response_details.status_code = 200
-        mock_response_details.json.return_value = {'id': '1', 'title': 'Test Dashboard', 'widgets': [{'id': 'w1'}]}
-        
-        mock_get.side_effect = [mock_response_ids, mock_response_details]
-
-        dashboards = self.migrator._get_source_dashboards()
-        self.assertEqual(len(dashboards), 1)
-        self.assertEqual(dashboards[0]['title'], 'Test Dashboard')
-        self.assertIn('widgets', dashboards[0])
-
-    @patch('requests.get')
-    def test_get_target_dashboards(self, mock_get):
-        # Mock the first call to get dashboard IDs
-        mock_response_ids = MagicMock()
-        mock_response_ids.status_code = 200
-        mock_response_ids.json.return_value = [{'id': '2', 'title': 'Existing Dashboard Summary'}]
-
-        # Mock the second call to get full dashboard details
-        mock_response_details = MagicMock()
-        mock_response_details.status_code = 200
-        mock_response_details.json.return_value = {'id': '2', 'title': 'Existing Dashboard', 'widgets': [{'id': 'w2'}]}
-        
-        mock_get.side_effect = [mock_response_ids, mock_response_details]
-
-        dashboards = self.migrator._get_target_dashboards()
-        self.assertEqual(len(dashboards), 1)
-        self.assertEqual(dashboards[0]['title'], 'Existing Dashboard')
-        self.assertIn('widgets', dashboards[0])
-
-    @patch('requests.get')
-    def test_get_shareable_users(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{'id': 'user1', 'email': 'test@example.com'}]
-        mock_get.return_value = mock_response
-
-        users = self.migrator._get_shareable_users(self.config.source_url, self.config.get_source_headers())
-        self.assertEqual(len(users), 1)
-        self.assertEqual(users[0]['email'], 'test@example.com')
-
-    def test_map_users(self):
-        source_users = [{'id': 'src_user1', 'email': 'test@example.com'}]
-        target_users = [{'id': 'tgt_user1', 'email': 'test@example.com'}]
-        user_map = self.migrator._map_users(source_users, target_users)
-        self.assertEqual(user_map['src_user1'], 'tgt_user1')
-
-    @patch('requests.post')
-    def test_create_dashboard(self, mock_post):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'id': 'new_dashboard_id'}
-        mock_post.return_value = mock_response
-
-        success = self.migrator._create_dashboard({'title': 'New Dashboard'})
-        self.assertTrue(success)
-
-    @patch('requests.put')
-    def test_update_dashboard(self, mock_put):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'id': 'updated_dashboard_id'}
-        mock_put.return_value = mock_response
-
-        target_dashboards = [{'id': 'dashboard_to_update', 'title': 'Dashboard to Update'}]
-        success = self.migrator._update_dashboard({'title': 'Dashboard to Update'}, 'Dashboard to Update', target_dashboards)
-        self.assertTrue(success)
-
-    @patch.object(CustomDashboardsMigrator, '_get_source_dashboards')
-    @patch.object(CustomDashboardsMigrator, '_get_target_dashboards')
-    @patch.object(CustomDashboardsMigrator, '_get_shareable_users')
-    @patch.object(CustomDashboardsMigrator, '_map_users')
-    def test_migrate_skip_existing(self, mock_map_users, mock_get_users, mock_get_target, mock_get_source):
-        mock_get_source.return_value = [{'id': '1', 'title': 'Test Dashboard', 'owner': 'src_user1', 'widgets': [{'id': 'w1', 'width': 1, 'height': 1, 'config': {}}]}]
-        mock_get_target.return_value = [{'id': '2', 'title': 'Test Dashboard'}]
-        mock_get_users.return_value = [{'id': 'src_user1', 'email': 'test@example.com'}]
-        mock_map_users.return_value = {'src_user1': 'tgt_user1'}
-
-        result = self.migrator._migrate_sync()
-        self.assertEqual(result['skipped'], 1)
-        self.assertEqual(result['migrated'], 0)
-
-if __name__ == '__main__':
-    unittest.main()
+
+@pytest.fixture
+def dashboards_migrator(base_config, monkeypatch):
+    """A migrator wired to the shared session config."""
+    monkeypatch.setattr(base_config, 'on_duplicate', 'skip')
+    migrator = CustomDashboardsMigrator(base_config)
+    # Force the synchronous execution path so mocks apply
+    migrator._use_async = False
+    migrator.req_custom_dashboards = "/api/custom-dashboard"
+    migrator.req_shareable_users = "/api/settings/users"
+    return migrator
+
+
+@pytest.fixture
+def mig_mocks(dashboards_migrator):
+    """Stub every helper the migrate tests replace in one patch.multiple.
+
+    One context manager instead of a stack of patch.object decorators
+    per test; tests pull the mocks they need from the mapping.
+    """
+    with patch.multiple(dashboards_migrator,
+                        _get_source_dashboards=DEFAULT,
+                        _get_target_dashboards=DEFAULT,
+                        _get_shareable_users=DEFAULT,
+                        _map_users=DEFAULT) as mocks:
+        yield mocks
+
+
+@patch('requests.Session.get')
+def test_get_source_dashboards(mock_get, dashboards_migrator, fake_resp):
+    """Test fetching source dashboards resolves summaries into details."""
+    mock_get.side_effect = [
+        fake_resp(200, [{'id': '1', 'title': 'Test Dashboard Summary'}]),
+        fake_resp(200, {'id': '1', 'title': 'Test Dashboard', 'widgets': [{'id': 'w1'}]}),
+    ]
+
+    dashboards = dashboards_migrator._get_source_dashboards()
+
+    assert len(dashboards) == 1
+    assert dashboards[0]['title'] == 'Test Dashboard'
+    assert 'widgets' in dashboards[0]
+
+
+@patch('requests.Session.get')
+def test_get_target_dashboards(mock_get, dashboards_migrator, fake_resp):
+    """Test fetching target dashboards resolves summaries into details."""
+    mock_get.side_effect = [
+        fake_resp(200, [{'id': '2', 'title': 'Existing Dashboard Summary'}]),
+        fake_resp(200, {'id': '2', 'title': 'Existing Dashboard', 'widgets': [{'id': 'w2'}]}),
+    ]
+
+    dashboards = dashboards_migrator._get_target_dashboards()
+
+    assert len(dashboards) == 1
+    assert dashboards[0]['title'] == 'Existing Dashboard'
+    assert 'widgets' in dashboards[0]
+
+
+@patch('requests.get')
+def test_get_shareable_users(mock_get, dashboards_migrator, base_config, fake_resp):
+    """Test fetching the shareable user listing."""
+    mock_get.return_value = fake_resp(200, [{'id': 'user1', 'email': 'test@example.com'}])
+
+    users = dashboards_migrator._get_shareable_users(
+        base_config.source_url, base_config.get_source_headers())
+
+    assert len(users) == 1
+    assert users[0]['email'] == 'test@example.com'
+
+
+def test_map_users(dashboards_migrator):
+    """Test mapping source users to target users by email."""
+    source_users = [{'id': 'src_user1', 'email': 'test@example.com'}]
+    target_users = [{'id': 'tgt_user1', 'email': 'test@example.com'}]
+
+    user_map = dashboards_migrator._map_users(source_users, target_users)
+
+    assert user_map['src_user1'] == 'tgt_user1'
+
+
+@patch('requests.post')
+def test_create_dashboard(mock_post, dashboards_migrator, fake_resp):
+    """Test successful dashboard creation."""
+    mock_post.return_value = fake_resp(200, {'id': 'new_dashboard_id'})
+
+    success = dashboards_migrator._create_dashboard({'title': 'New Dashboard'})
+
+    assert success
+
+
+@patch('requests.put')
+def test_update_dashboard(mock_put, dashboards_migrator, fake_resp):
+    """Test successful dashboard update."""
+    mock_put.return_value = fake_resp(200, {'id': 'updated_dashboard_id'})
+
+    target_dashboard = {'id': 'dashboard_to_update', 'title': 'Dashboard to Update'}
+    success = dashboards_migrator._update_dashboard(
+        {'title': 'Dashboard to Update'}, 'Dashboard to Update', target_dashboard)
+
+    assert success
+
+
+def test_migrate_skip_existing(mig_mocks, dashboards_migrator):
+    """Test that dashboards already present in the target are skipped."""
+    mig_mocks['_get_source_dashboards'].return_value = [
+        {'id': '1', 'title': 'Test Dashboard', 'owner': 'src_user1',
+         'widgets': [{'id': 'w1', 'width': 1, 'height': 1, 'config': {}}]}
+    ]
+    mig_mocks['_get_target_dashboards'].return_value = [{'id': '2', 'title': 'Test Dashboard'}]
+    mig_mocks['_get_shareable_users'].return_value = [{'id': 'src_user1', 'email': 'test@example.com'}]
+    mig_mocks['_map_users'].return_value = {'src_user1': 'tgt_user1'}
+
+    result = dashboards_migrator._migrate_sync()
+
+    assert result['skipped'] == 1
+    assert result['migrated'] == 0
@@ -1,34 +1,36 @@
 """Unit tests for the EventsMigrator class."""
 
 import pytest
+import io
 import json
-import tempfile
 import os
 import requests
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'custom-events-specification'))
 from migrator import EventsMigrator
 from config import Config
+import fast_json
 
 
 class TestEventsMigrator:
     """Test cases for the EventsMigrator class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = Config()
-        self.config.source_token = "source_token"
-        self.config.source_url = "https://source.com"
-        self.config.target_token = "target_token"
-        self.config.target_url = "https://target.com"
-        self.config.verify_ssl = True
-        self.config.events_source = "file"
-        self.config.events_file_path = "test_events.json"
-        
-        self.migrator = EventsMigrator(self.config)
+    @pytest.fixture(autouse=True)
+    def _setup(self, base_config, monkeypatch):
+        """Wire each test to the shared session config.
+
+        The Config is built once per session in conftest; tests that need
+        a different setting monkeypatch it so the change is undone after
+        the test instead of rebuilding the whole object every time.
+        """
+        self.config = base_config
+        self.monkeypatch = monkeypatch
+        self.migrator = EventsMigrator(base_config)
+        # Force the synchronous execution path so mocks apply
+        self.migrator._use_async = False
 
     def test_init(self):
         """Test migrator initialization."""
@@ -38,49 +40,51 @@ class TestEventsMigrator:
     @patch('migrator.urllib3.disable_warnings')
     def test_init_with_ssl_disabled(self, mock_disable_warnings):
         """Test migrator initialization with SSL verification disabled."""
-        self.config.verify_ssl = False
+        self.monkeypatch.setattr(self.config, 'verify_ssl', False)
         migrator = EventsMigrator(self.config)
         
         mock_disable_warnings.assert_called_once()
 
-    def test_get_source_events_from_file(self):
+    def test_get_source_events_from_file(self, events_file):
         """Test getting source events from file."""
-        test_events = [
+        self.monkeypatch.setattr(self.config, 'events_file_path', events_file)
+
+        events = self.migrator._get_source_events()
+
+        assert events == [
             {"name": "Test Event 1", "query": "test query 1"},
             {"name": "Test Event 2", "query": "test query 2"}
         ]
-        
-        with patch('builtins.open', mock_open(read_data=json.dumps(test_events))):
-            events = self.migrator._get_source_events()
-            
-            assert events == test_events
 
-    @patch('migrator.requests.get')
-    def test_get_source_events_from_api(self, mock_get):
+    @patch('migrator.requests.Session.get')
+    def test_get_source_events_from_api(self, mock_get, tmp_path, fake_resp):
         """Test getting source events from API."""
-        self.config.events_source = "api"
+        self.monkeypatch.setattr(self.config, 'events_source', 'api')
+        # The API path dumps the body to events_file_path before parsing;
+        # keep that write out of the working tree
+        self.monkeypatch.setattr(self.config, 'events_file_path', str(tmp_path / "events.json"))
         test_events = [
             {"name": "Test Event 1", "query": "test query 1"},
             {"name": "Test Event 2", "query": "test query 2"}
         ]
         
-        mock_response = MagicMock()
-        mock_response.json.return_value = test_events
-        mock_get.return_value = mock_response
-        
+        mock_get.return_value = fake_resp(raw=io.BytesIO(json.dumps(test_events).encode()))
+
         events = self.migrator._get_source_events()
-        
+
         assert events == test_events
         mock_get.assert_called_once_with(
             f"{self.config.source_url}{self.migrator.req_custom_events}",
             headers=self.config.get_source_headers(),
-            verify=self.config.verify_ssl
+            verify=self.config.verify_ssl,
+            stream=True,
+            timeout=(self.config.connect_timeout, self.config.request_timeout)
         )
 
-    @patch('migrator.requests.get')
+    @patch('migrator.requests.Session.get')
     def test_get_source_events_api_error(self, mock_get):
         """Test handling API error when getting source events."""
-        self.config.events_source = "api"
+        self.monkeypatch.setattr(self.config, 'events_source', 'api')
         
         mock_get.side_effect = requests.exceptions.RequestException("API Error")
         
@@ -88,31 +92,33 @@ class TestEventsMigrator:
         
         assert events is None
 
-    def test_get_source_events_file_not_found(self):
+    def test_get_source_events_file_not_found(self, tmp_path):
         """Test handling file not found error when getting source events."""
-        with patch('builtins.open', side_effect=FileNotFoundError):
-            events = self.migrator._get_source_events()
-            
-            assert events is None
+        self.monkeypatch.setattr(self.config, 'events_file_path', str(tmp_path / "missing.json"))
+
+        events = self.migrator._get_source_events()
+
+        assert events is None
 
-    def test_get_source_events_invalid_json(self):
+    def test_get_source_events_invalid_json(self, tmp_path):
         """Test handling invalid JSON when getting source events."""
-        with patch('builtins.open', mock_open(read_data="invalid json")):
-            events = self.migrator._get_source_events()
-            
-            assert events is None
+        bad_file = tmp_path / "events.json"
+        bad_file.write_text("invalid json")
+        self.monkeypatch.setattr(self.config, 'events_file_path', str(bad_file))
+
+        events = self.migrator._get_source_events()
+
+        assert events is None
 
-    @patch('migrator.requests.get')
-    def test_get_target_events(self, mock_get):
+    @patch('migrator.requests.Session.get')
+    def test_get_target_events(self, mock_get, fake_resp):
         """Test getting target events."""
         test_events = [
             {"name": "Existing Event 1", "id": "1"},
             {"name": "Existing Event 2", "id": "2"}
         ]
         
-        mock_response = MagicMock()
-        mock_response.json.return_value = test_events
-        mock_get.return_value = mock_response
+        mock_get.return_value = fake_resp(200, test_events)
         
         events = self.migrator._get_target_events()
         
@@ -120,10 +126,26 @@ class TestEventsMigrator:
         mock_get.assert_called_once_with(
             f"{self.config.target_url}{self.migrator.req_custom_events}",
             headers=self.config.get_target_headers(),
-            verify=self.config.verify_ssl
+            verify=self.config.verify_ssl,
+            timeout=(self.config.connect_timeout, self.config.request_timeout)
         )
 
-    @patch('migrator.requests.get')
+    @patch('migrator.requests.Session.get')
+    def test_get_target_events_not_modified(self, mock_get, fake_resp):
+        """Test that a 304 response returns the cached target events."""
+        cached_events = [{"name": "Cached Event", "id": "1"}]
+
+        mock_get.return_value = fake_resp(304)
+
+        with patch.object(self.migrator, '_load_target_cache',
+                          return_value={"etag": '"abc"', "body": cached_events}):
+            events = self.migrator._get_target_events()
+
+        assert events == cached_events
+        headers = mock_get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc"'
+
+    @patch('migrator.requests.Session.get')
     def test_get_target_events_error(self, mock_get):
         """Test handling error when getting target events."""
         mock_get.side_effect = requests.exceptions.RequestException("API Error")
@@ -164,15 +186,12 @@ class TestEventsMigrator:
         assert choice == "skip"
         assert mock_input.call_count == 2
 
-    @patch('migrator.requests.post')
-    def test_create_event_success(self, mock_post):
+    @patch('migrator.requests.Session.post')
+    def test_create_event_success(self, mock_post, fake_resp):
         """Test successful event creation."""
         event = {"name": "Test Event", "query": "test query"}
         
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "new_id"}
-        mock_post.return_value = mock_response
+        mock_post.return_value = fake_resp(201, {"id": "new_id"})
         
         result = self.migrator._create_event(event, "Test Event")
         
@@ -180,24 +199,23 @@ class TestEventsMigrator:
         mock_post.assert_called_once_with(
             f"{self.config.target_url}{self.migrator.req_custom_events}",
             headers=self.config.get_target_headers(),
-            json=event,
-            verify=self.config.verify_ssl
+            data=fast_json.dumps(event),
+            verify=self.config.verify_ssl,
+            timeout=(self.config.connect_timeout, self.config.request_timeout)
         )
 
-    @patch('migrator.requests.post')
-    def test_create_event_failure(self, mock_post):
+    @patch('migrator.requests.Session.post')
+    def test_create_event_failure(self, mock_post, fake_resp):
         """Test failed event creation."""
         event = {"name": "Test Event", "query": "test query"}
         
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_post.return_value = mock_response
+        mock_post.return_value = fake_resp(400)
         
         result = self.migrator._create_event(event, "Test Event")
         
         assert result is False
 
-    @patch('migrator.requests.post')
+    @patch('migrator.requests.Session.post')
     def test_create_event_exception(self, mock_post):
         """Test event creation with exception."""
         event = {"name": "Test Event", "query": "test query"}
@@ -208,50 +226,45 @@ class TestEventsMigrator:
         
         assert result is False
 
-    @patch('migrator.requests.put')
-    def test_update_event_success(self, mock_put):
+    @patch('migrator.requests.Session.put')
+    def test_update_event_success(self, mock_put, fake_resp):
         """Test successful event update."""
         event = {"name": "Test Event", "query": "updated query"}
-        target_events = [{"name": "Test Event", "id": "existing_id"}]
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "existing_id"}
-        mock_put.return_value = mock_response
-        
-        result = self.migrator._update_event(event, "Test Event", target_events)
-        
+        target_event = {"name": "Test Event", "id": "existing_id"}
+
+        mock_put.return_value = fake_resp(200, {"id": "existing_id"})
+
+        result = self.migrator._update_event(event, "Test Event", target_event)
+
         assert result is True
         mock_put.assert_called_once_with(
             f"{self.config.target_url}{self.migrator.req_custom_events}/existing_id",
             headers=self.config.get_target_headers(),
-            json=event,
-            verify=self.config.verify_ssl
+            data=fast_json.dumps(event),
+            verify=self.config.verify_ssl,
+            timeout=(self.config.connect_timeout, self.config.request_timeout)
         )
 
-    @patch('migrator.requests.put')
+    @patch('migrator.requests.Session.put')
     def test_update_event_not_found(self, mock_put):
         """Test event update when target event not found."""
         event = {"name": "Test Event", "query": "updated query"}
-        target_events = [{"name": "Other Event", "id": "other_id"}]
-        
-        result = self.migrator._update_event(event, "Test Event", target_events)
-        
+
+        result = self.migrator._update_event(event, "Test Event", None)
+
         assert result is False
         mock_put.assert_not_called()
 
-    @patch('migrator.requests.put')
-    def test_update_event_failure(self, mock_put):
+    @patch('migrator.requests.Session.put')
+    def test_update_event_failure(self, mock_put, fake_resp):
         """Test failed event update."""
         event = {"name": "Test Event", "query": "updated query"}
-        target_events = [{"name": "Test Event", "id": "existing_id"}]
-        
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_put.return_value = mock_response
-        
-        result = self.migrator._update_event(event, "Test Event", target_events)
-        
+        target_event = {"name": "Test Event", "id": "existing_id"}
+
+        mock_put.return_value = fake_resp(400)
+
+        result = self.migrator._update_event(event, "Test Event", target_event)
+
         assert result is False
 
     @patch.object(EventsMigrator, '_get_source_events')
@@ -272,7 +285,27 @@ class TestEventsMigrator:
         
         result = self.migrator.migrate()
         
-        assert result == {"source": 2, "migrated": 2, "updated": 0, "skipped": 0}
+        assert result == {"source": 2, "migrated": 2, "updated": 0, "skipped": 0, "deduped": 0}
+        assert mock_create.call_count == 2
+
+    @patch.object(EventsMigrator, '_get_source_events')
+    @patch.object(EventsMigrator, '_get_target_events')
+    @patch.object(EventsMigrator, '_create_event')
+    def test_migrate_dedupes_repeated_source_names(self, mock_create, mock_get_target, mock_get_source):
+        """Test that repeated source event names are created only once."""
+        source_events = [
+            {"name": "Event 1", "query": "query 1"},
+            {"name": "Event 1", "query": "query 1 again"},
+            {"name": "Event 2", "query": "query 2"}
+        ]
+
+        mock_get_source.return_value = source_events
+        mock_get_target.return_value = []
+        mock_create.return_value = True
+
+        result = self.migrator.migrate()
+
+        assert result == {"source": 3, "migrated": 2, "updated": 0, "skipped": 0, "deduped": 1}
         assert mock_create.call_count == 2
 
     @patch.object(EventsMigrator, '_get_source_events')
@@ -296,9 +329,74 @@ class TestEventsMigrator:
         
         result = self.migrator.migrate()
         
-        assert result == {"source": 2, "migrated": 1, "updated": 1, "skipped": 0}
+        assert result == {"source": 2, "migrated": 1, "updated": 1, "skipped": 0, "deduped": 0}
         mock_update.assert_called_once()
 
+    @patch.object(EventsMigrator, '_get_source_events')
+    @patch.object(EventsMigrator, '_get_target_events')
+    @patch.object(EventsMigrator, '_prompt_for_duplicate_event')
+    @patch.object(EventsMigrator, '_update_event')
+    @patch.object(EventsMigrator, '_create_event')
+    def test_migrate_cancel_dispatches_nothing(self, mock_create, mock_update, mock_prompt,
+                                               mock_get_target, mock_get_source):
+        """Test that cancelling at a duplicate aborts the queued creates too."""
+        source_events = [
+            {"name": "Event 1", "query": "query 1"},
+            {"name": "Event 2", "query": "query 2"}
+        ]
+        target_events = [{"name": "Event 1", "id": "existing_id"}]
+
+        mock_get_source.return_value = source_events
+        mock_get_target.return_value = target_events
+        mock_prompt.return_value = "cancel"
+
+        result = self.migrator.migrate()
+
+        assert result == {"source": 2, "migrated": 0, "updated": 0, "skipped": 0, "deduped": 0}
+        mock_create.assert_not_called()
+        mock_update.assert_not_called()
+
+    @patch.object(EventsMigrator, '_get_source_events')
+    @patch.object(EventsMigrator, '_get_target_events')
+    @patch.object(EventsMigrator, '_prompt_for_duplicate_event')
+    @patch.object(EventsMigrator, '_create_event')
+    def test_migrate_on_duplicate_configured(self, mock_create, mock_prompt, mock_get_target, mock_get_source):
+        """Test that a configured duplicate action suppresses all prompts."""
+        self.monkeypatch.setattr(self.config, 'on_duplicate', 'skip')
+        source_events = [
+            {"name": "Event 1", "query": "query 1"},
+            {"name": "Event 2", "query": "query 2"}
+        ]
+        target_events = [
+            {"name": "Event 1", "id": "existing_id"},
+            {"name": "Event 2", "id": "other_id"}
+        ]
+
+        mock_get_source.return_value = source_events
+        mock_get_target.return_value = target_events
+
+        result = self.migrator.migrate()
+
+        assert result == {"source": 2, "migrated": 0, "updated": 0, "skipped": 2, "deduped": 0}
+        mock_prompt.assert_not_called()
+        mock_create.assert_not_called()
+
+    @patch('builtins.input', return_value='u')
+    def test_prompt_for_duplicate_batch_update_all(self, mock_input):
+        """Test the batch prompt - apply update to all duplicates."""
+        choice = self.migrator._prompt_for_duplicate_batch(["Event 1", "Event 2"])
+
+        assert choice == "update"
+        mock_input.assert_called_once()
+
+    @patch('builtins.input', return_value='a')
+    def test_prompt_for_duplicate_batch_ask_each(self, mock_input):
+        """Test the batch prompt - fall back to per-event prompts."""
+        choice = self.migrator._prompt_for_duplicate_batch(["Event 1", "Event 2"])
+
+        assert choice is None
+        mock_input.assert_called_once()
+
     @patch.object(EventsMigrator, '_get_source_events')
     def test_migrate_no_source_events(self, mock_get_source):
         """Test migration when no source events exist."""
@@ -334,7 +432,7 @@ class TestEventsMigrator:
                 with patch.object(self.migrator, '_create_event', return_value=True):
                     result = self.migrator.migrate()
                     
-                    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 1}
+                    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 1, "deduped": 0}
 
     def test_migrate_skip_event_without_name(self):
         """Test that events without name are skipped."""
@@ -349,4 +447,4 @@ class TestEventsMigrator:
                 with patch.object(self.migrator, '_create_event', return_value=True):
                     result = self.migrator.migrate()
                     
-                    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 0}
+                    assert result == {"source": 2, "migrated": 1, "updated": 0, "skipped": 0, "deduped": 0}
@@ -2,11 +2,34 @@ import sys
 import requests
 import urllib3
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional, Tuple
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config import Config
 
+# ijson parses the source file incrementally instead of materializing the
+# whole document before the first website is inspected; plain json is the
+# fallback. Prefer the C backend, which is much faster than the pure-Python
+# one.
+try:
+    import ijson
+    try:
+        import ijson.backends.yajl2_c as ijson_backend
+    except ImportError:
+        ijson_backend = ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Parse failures the file reader reports; ijson raises its own error type
+# for malformed documents
+_SOURCE_PARSE_ERRORS = (json.JSONDecodeError,)
+if IJSON_AVAILABLE:
+    _SOURCE_PARSE_ERRORS = _SOURCE_PARSE_ERRORS + (ijson.JSONError,)
+
 class WebsiteConfigMigrator:
     "Handles migration of website configs"
 
@@ -18,6 +41,26 @@ class WebsiteConfigMigrator:
         self.config = config
         self.req_website_config = "/api/website-monitoring/config"
 
+        # Build the auth headers and endpoint URLs once; they are
+        # identical for every request
+        self._source_headers = config.get_source_headers()
+        self._target_headers = config.get_target_headers()
+        self._source_config_url = f"{config.source_url}{self.req_website_config}"
+        self._target_config_url = f"{config.target_url}{self.req_website_config}"
+        # Create URL prefix; only the website name varies per call
+        self._create_name_url = self._target_config_url + "?name="
+
+        # Reuse one pooled session so keep-alive connections are shared
+        # across all requests instead of a new TLS handshake per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Disable SSL warnings if verify_ssl is False
         if not config.verify_ssl:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -30,19 +73,25 @@ class WebsiteConfigMigrator:
         """
         if self.config.events_source=="file":
             try:
+                if IJSON_AVAILABLE:
+                    # Incremental parse keeps peak memory at roughly one
+                    # website object instead of the whole export
+                    with open(self.config.events_file_path, 'rb') as f:
+                        return list(ijson_backend.items(f, 'item', use_float=True))
                 with open(self.config.events_file_path, 'r') as f:
                     return json.load(f)
             except FileNotFoundError:
                 print(f"ERROR: Source file {self.config.events_file_path} not found")
                 return []
-            except json.JSONDecodeError:
+            except _SOURCE_PARSE_ERRORS:
                 print(f"ERROR: Invalid JSON in source file {self.config.events_file_path}")
                 return []
         else:
             try:
-                response = requests.get(f"{self.config.source_url}{self.req_website_config}",
-                headers=self.config.get_source_headers(),
-                verify=self.config.verify_ssl,
+                response = self.session.get(
+                    self._source_config_url,
+                    headers=self._source_headers,
+                    verify=self.config.verify_ssl,
                 )
                 response.raise_for_status()
                 return response.json()
@@ -57,9 +106,10 @@ class WebsiteConfigMigrator:
             List of website configurations or None if failed
         """
         try:
-            response = requests.get(f"{self.config.target_url}{self.req_website_config}",
-            headers = self.config.get_target_headers(),
-            verify = self.config.verify_ssl
+            response = self.session.get(
+                self._target_config_url,
+                headers=self._target_headers,
+                verify=self.config.verify_ssl
             )
             response.raise_for_status()
             return response.json() 
@@ -81,23 +131,51 @@ class WebsiteConfigMigrator:
 
         return mapping
 
-    def _create_website_config(self, website_name: str) -> bool:
-        """Create a website in the target backend using the name from source."""
+    def _create_website_config(self, website_name: str) -> Optional[Dict[str, Any]]:
+        """Create a website in the target backend using the name from source.
 
+        Returns:
+            The created website object from the API response, an empty
+            dict when the response carries no body, or None on failure
+        """
         try:
-            response = requests.post(
-                f"{self.config.target_url}{self.req_website_config}?name={website_name}",
-                headers=self.config.get_target_headers(),
+            response = self.session.post(
+                self._create_name_url + website_name,
+                headers=self._target_headers,
                 json=[],
                 verify=self.config.verify_ssl
             )
             response.raise_for_status()
             print(f"Successfully created website '{website_name}'")
-            return True
+            try:
+                return response.json()
+            except ValueError:
+                # Success without a body; migrate() resolves the id later
+                return {}
         except Exception as e:
             print(f"Error creating website '{website_name}' in target backend: {e}")
-            return False
+            return None
             
+    # The website API has no bulk create endpoint, so round trips are
+    # amortized by issuing the per-site POSTs concurrently over one
+    # shared keep-alive pool.
+    def _execute_creates(self, items: List[Tuple[str, str]],
+                         max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Run the collected create calls, in parallel when possible.
+
+        Args:
+            items: List of (source_id, website_name) tuples to create
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Create results in the same order as items
+        """
+        names = [name for _, name in items]
+        if len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+                return list(executor.map(self._create_website_config, names))
+        return [self._create_website_config(name) for name in names]
+
     def migrate(self) -> Dict[str, Any]:
         """Perform the migration of the website configurations.
 
@@ -126,8 +204,11 @@ class WebsiteConfigMigrator:
 
         migrated_count = 0
         skipped_count = 0
+        # Created websites whose id was not in the create response
+        unresolved = []
 
-        # Process each source website
+        # Phase 1: classify each source website
+        to_create: List[Tuple[str, str]] = []
         for source_website in source_websites:
             source_id = source_website.get('id')
             source_name = source_website.get('name')
@@ -142,16 +223,27 @@ class WebsiteConfigMigrator:
                 skipped_count += 1
                 continue
 
-            # Create website in target
-            if self._create_website_config(source_name):
-                # Get updated target websites to find the newly created website's ID
-                updated_target_websites = self._get_target_website_config()
-                if updated_target_websites:
-                    for target_website in updated_target_websites:
-                        if target_website.get('name') == source_name:
-                            website_mapping[source_id] = target_website.get('id')
-                            break
+            to_create.append((source_id, source_name))
+
+        # Phase 2: the creates are independent, so issue them concurrently
+        # over the pooled session; the POST response already carries the
+        # created object, so no listing refetch per create
+        for (source_id, source_name), created in zip(to_create, self._execute_creates(to_create)):
+            if created is not None:
                 migrated_count += 1
+                if created.get('id'):
+                    website_mapping[source_id] = created['id']
+                else:
+                    unresolved.append((source_id, source_name))
+
+        # Resolve any missing ids with one final listing fetch instead of
+        # one per created website
+        if unresolved:
+            target_by_name = {website.get('name'): website.get('id')
+                              for website in self._get_target_website_config() or []}
+            for source_id, source_name in unresolved:
+                if source_name in target_by_name:
+                    website_mapping[source_id] = target_by_name[source_name]
 
         print(f"Migration complete. Found {len(source_websites)} source websites, "
               f"migrated {migrated_count} websites, skipped {skipped_count} existing websites.")